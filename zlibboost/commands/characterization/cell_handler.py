@@ -91,10 +91,13 @@ class CellHandler(BaseCommandHandler):
             cell = Cell(name=cell_name)
 
             # 添加引脚信息
-            for pin_name in pin_list:
-                direction = "input" if pin_name in input_pins else "output" if pin_name in output_pins else "input"
-                pin_info = PinInfo(name=pin_name, direction=direction)    
-                cell.add_pin(pin_info)
+            cell.add_pins(
+                PinInfo(
+                    name=pin_name,
+                    direction="input" if pin_name in input_pins else "output" if pin_name in output_pins else "input",
+                )
+                for pin_name in pin_list
+            )
 
             # 设置模板信息
             cell.delay_template = delay_template
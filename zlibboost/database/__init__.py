@@ -6,8 +6,8 @@ This package provides data models and database management for timing libraries.
 
 from .library_db import CellLibraryDB
 from .models import (
-    Cell, PinInfo, TimingArc, Template, Waveform,
-    TimingType, TableType, PinDirection, TransitionDirection
+    Cell, PinInfo, TimingArc, Template, TemplateTable, Waveform,
+    TimingType, TableType, PinDirection, TransitionDirection, TemplateType
 )
 
 __all__ = [
@@ -16,9 +16,11 @@ __all__ = [
     'PinInfo',
     'TimingArc',
     'Template',
+    'TemplateTable',
     'Waveform',
     'TimingType',
     'TableType',
     'PinDirection',
-    'TransitionDirection'
+    'TransitionDirection',
+    'TemplateType'
 ]
\ No newline at end of file
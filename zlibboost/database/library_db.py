@@ -14,7 +14,7 @@ from zlibboost.core.exceptions import (
     WaveformNotFoundError, ConfigurationError
 )
 from zlibboost.core.logger import get_logger
-from .models import Cell, TimingArc, Template, Waveform
+from .models import Cell, TimingArc, Template, TemplateTable, Waveform
 
 logger = get_logger(__name__)
 
@@ -222,6 +222,15 @@ class CellLibraryDB:
         if template.template_type == template_type
         ]
 
+    def get_template_table(self) -> TemplateTable:
+        """
+        Get a column-oriented snapshot of all templates.
+        
+        Returns:
+            TemplateTable with one row per template, in insertion order
+        """
+        return TemplateTable.from_templates(self.templates.values())
+
     def _maybe_add_flat_constraint_template(self, template: Template) -> None:
         """Ensure constraint templates expose 3x1派生模板供MPW复用。"""
 
@@ -451,7 +460,7 @@ class CellLibraryDB:
         """
         return {
             'cells': {name: cell.to_dict() for name, cell in self.cells.items()},
-            'templates': {name: template.to_dict() for name, template in self.templates.items()},
+            'templates': {name: template.to_dict(copy=True) for name, template in self.templates.items()},
             'driver_waveforms': {name: waveform.to_dict() for name, waveform in self.driver_waveforms.items()},
             'config_params': self.config_params.copy(),
             'stats': self.get_library_stats()
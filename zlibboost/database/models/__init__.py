@@ -7,7 +7,7 @@ components including cells, timing arcs, templates, and waveforms.
 
 from .cell import Cell, PinInfo
 from .timing_arc import TimingArc, TimingType, TableType, PinDirection, TransitionDirection
-from .template import Template
+from .template import Template, TemplateTable, TemplateType
 from .waveform import Waveform
 
 __all__ = [
@@ -19,5 +19,7 @@ __all__ = [
     'PinDirection',
     'TransitionDirection',
     'Template',
+    'TemplateTable',
+    'TemplateType',
     'Waveform'
 ]
\ No newline at end of file
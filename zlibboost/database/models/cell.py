@@ -5,7 +5,8 @@ This module defines the Cell class for managing standard cell information
 including pins, timing arcs, and logical functions.
 """
 
-from typing import Dict, List, Any, Optional, Set, TYPE_CHECKING
+import sys
+from typing import Dict, FrozenSet, Iterable, List, Any, Optional, Set, TYPE_CHECKING
 from dataclasses import dataclass, field
 
 from zlibboost.core.exceptions import ValidationError
@@ -15,48 +16,78 @@ if TYPE_CHECKING:
     from zlibboost.arc_generation.logic_analyzer import LogicFunctionAnalyzer
 
 
+# Resolved on first use; importing at module load would be circular
+# (arc_generation imports the database models).
+_LogicFunctionAnalyzer = None
+
+
+def _get_analyzer_cls():
+    """Import LogicFunctionAnalyzer once and cache it at module level."""
+    global _LogicFunctionAnalyzer
+    if _LogicFunctionAnalyzer is None:
+        from zlibboost.arc_generation.logic_analyzer import LogicFunctionAnalyzer
+        _LogicFunctionAnalyzer = LogicFunctionAnalyzer
+    return _LogicFunctionAnalyzer
+
+
 # Pin category constants
 class PinCategory:
-    """Pin category constants for consistent categorization."""
+    """Pin category bit flags for consistent categorization.
+
+    Categories are stored on ``PinInfo`` as a single integer bitmask so that
+    membership tests reduce to a bitwise AND. Flags may be OR-ed together to
+    query several categories at once.
+    """
     # Clock related
-    CLOCK = 'clock'              # Clock pins (use with is_negative for edge polarity)
+    CLOCK = 1 << 0               # Clock pins (use with is_negative for edge polarity)
     
     # Enable related
-    ENABLE = 'enable'            # Enable pins (use with is_negative for active level)
+    ENABLE = 1 << 1              # Enable pins (use with is_negative for active level)
     
     # Scan chain related
-    SCAN_ENABLE = 'scan_enable'  # Scan enable pins
-    SCAN_IN = 'scan_in'          # Scan input pins
+    SCAN_ENABLE = 1 << 2         # Scan enable pins
+    SCAN_IN = 1 << 3             # Scan input pins
     
     # Data related
-    DATA = 'data'                # Data pins
+    DATA = 1 << 4                # Data pins
     
     # Asynchronous control
-    ASYNC = 'async'              # Asynchronous pins
-    RESET = 'reset'              # Reset pins (typically active low)
-    SET = 'set'                  # Set pins (typically active low)
+    ASYNC = 1 << 5               # Asynchronous pins
+    RESET = 1 << 6               # Reset pins (typically active low)
+    SET = 1 << 7                 # Set pins (typically active low)
     
     # Synchronous control
-    SYNC = 'sync'                # Synchronous pins
+    SYNC = 1 << 8                # Synchronous pins
     
 
     # SPECIAL
-    INTERNAL = 'internal'        # Internal pins
-
-# All valid categories for validation
-VALID_PIN_CATEGORIES = {
-    PinCategory.CLOCK,
-    PinCategory.ENABLE,
-    PinCategory.SCAN_ENABLE,
-    PinCategory.SCAN_IN,
-    PinCategory.DATA,
-    PinCategory.ASYNC,
-    PinCategory.RESET,
-    PinCategory.SET,
-    PinCategory.SYNC,
-    PinCategory.INTERNAL
+    INTERNAL = 1 << 9            # Internal pins
+
+# Category flag -> legacy string name (used for serialization and messages)
+PIN_CATEGORY_NAMES: Dict[int, str] = {
+    PinCategory.CLOCK: 'clock',
+    PinCategory.ENABLE: 'enable',
+    PinCategory.SCAN_ENABLE: 'scan_enable',
+    PinCategory.SCAN_IN: 'scan_in',
+    PinCategory.DATA: 'data',
+    PinCategory.ASYNC: 'async',
+    PinCategory.RESET: 'reset',
+    PinCategory.SET: 'set',
+    PinCategory.SYNC: 'sync',
+    PinCategory.INTERNAL: 'internal',
 }
 
+# Mask of all valid category bits for validation
+ALL_PIN_CATEGORIES = sum(PIN_CATEGORY_NAMES)  # flags are disjoint bits
+
+_SCAN_CATEGORIES = PinCategory.SCAN_ENABLE | PinCategory.SCAN_IN
+_SEQUENTIAL_CATEGORIES = PinCategory.CLOCK | PinCategory.ENABLE
+_ASYNC_CONTROL_CATEGORIES = PinCategory.ASYNC | PinCategory.RESET | PinCategory.SET
+
+# Pin direction sets
+_VALID_DIRECTIONS = frozenset(('input', 'output', 'inout', 'internal'))
+_OUTPUT_LIKE_DIRECTIONS = frozenset(('output', 'inout', 'internal'))  # may carry a function
+
 
 @dataclass
 class PinInfo:
@@ -67,7 +98,7 @@ class PinInfo:
         name: Pin name
         direction: Pin direction ('input', 'output', 'inout')
         position: Position in vector string (0-based index)
-        categories: Set of pin categories (e.g., 'clock', 'data', 'enable', 'reset')
+        categories: Bitmask of PinCategory flags (e.g., CLOCK | DATA)
         is_negative: Whether this is a negative/inverted pin
         capacitance: Input capacitance (for input pins)
         max_capacitance: Maximum load capacitance (for output pins)
@@ -77,32 +108,63 @@ class PinInfo:
     name: str
     direction: str
     position: Optional[int] = None
-    categories: Set[str] = field(default_factory=set)
+    categories: int = 0
     is_negative: bool = False
     capacitance: Optional[float] = None
     max_capacitance: Optional[float] = None
     function: Optional['LogicFunctionAnalyzer'] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Cells holding this pin, notified by the mutators below so their indexes stay fresh
+    _owners: List['Cell'] = field(default_factory=list, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate pin information after initialization."""
         if not self.name:
             raise ValidationError("Pin name cannot be empty")
         
-        valid_directions = {'input', 'output', 'inout', 'internal'}
-        if self.direction not in valid_directions:
+        if self.direction not in _VALID_DIRECTIONS:
             raise ValidationError(
                 f"Invalid pin direction '{self.direction}'. "
-                f"Must be one of: {valid_directions}"
+                f"Must be one of: {set(_VALID_DIRECTIONS)}"
             )
         
+        # Interned names/directions make the many dict lookups and equality
+        # tests against pin names and direction literals pointer-cheap.
+        self.name = sys.intern(self.name)
+        self.direction = sys.intern(self.direction)
 
+    def _attach(self, cell: 'Cell') -> None:
+        """Register a cell that holds this pin (Cell is unhashable, so compare by identity)."""
+        if not any(owner is cell for owner in self._owners):
+            self._owners.append(cell)
+    
+    def _notify_owners(self) -> None:
+        """Drop the pin indexes of every cell holding this pin."""
+        for owner in self._owners:
+            owner._invalidate_pin_indexes()
+    
+    def set_direction(self, direction: str) -> None:
+        """Change the pin direction.
+        
+        Args:
+            direction: New direction ('input', 'output', 'inout', 'internal')
+            
+        Raises:
+            ValidationError: If direction is invalid
+        """
+        if direction not in _VALID_DIRECTIONS:
+            raise ValidationError(
+                f"Invalid pin direction '{direction}'. "
+                f"Must be one of: {set(_VALID_DIRECTIONS)}"
+            )
+        self.direction = sys.intern(direction)
+        self._notify_owners()
     
-    def has_category(self, category: str) -> bool:
-        """Check if pin has a specific category."""
-        return category in self.categories
+    def has_category(self, category: int) -> bool:
+        """Check if pin has a specific category (or any of several OR-ed flags)."""
+        return bool(self.categories & category)
     
-    def add_category(self, category: str) -> None:
+    def add_category(self, category: int) -> None:
         """Add a category to this pin.
         
         Args:
@@ -111,48 +173,55 @@ class PinInfo:
         Raises:
             ValidationError: If category is invalid
         """
-        if category not in VALID_PIN_CATEGORIES:
+        if not isinstance(category, int) or not category or category & ~ALL_PIN_CATEGORIES:
             raise ValidationError(
                 f"Invalid pin category '{category}'. "
-                f"Valid categories are: {sorted(VALID_PIN_CATEGORIES)}"
+                f"Valid categories are: {sorted(PIN_CATEGORY_NAMES.values())}"
             )
-        self.categories.add(category)
+        self.categories |= category
+        self._notify_owners()
     
-    def remove_category(self, category: str) -> None:
+    def remove_category(self, category: int) -> None:
         """Remove a category from this pin."""
-        self.categories.discard(category)
+        self.categories &= ~category
+        self._notify_owners()
+    
+    def categories_as_strings(self) -> Set[str]:
+        """Return the pin categories as their legacy string names."""
+        categories = self.categories
+        return {name for flag, name in PIN_CATEGORY_NAMES.items() if categories & flag}
     
     def is_clock(self) -> bool:
         """Check if this is a clock pin."""
-        return PinCategory.CLOCK in self.categories
+        return bool(self.categories & PinCategory.CLOCK)
     
     def is_data(self) -> bool:
         """Check if this is a data pin."""
-        return PinCategory.DATA in self.categories
+        return bool(self.categories & PinCategory.DATA)
     
     def is_enable(self) -> bool:
         """Check if this is an enable pin."""
-        return PinCategory.ENABLE in self.categories
+        return bool(self.categories & PinCategory.ENABLE)
     
     def is_reset(self) -> bool:
         """Check if this is a reset pin."""
-        return PinCategory.RESET in self.categories
+        return bool(self.categories & PinCategory.RESET)
     
     def is_set(self) -> bool:
         """Check if this is a set pin."""
-        return PinCategory.SET in self.categories
+        return bool(self.categories & PinCategory.SET)
     
     def is_scan(self) -> bool:
         """Check if this is a scan-related pin."""
-        return PinCategory.SCAN_ENABLE in self.categories or PinCategory.SCAN_IN in self.categories
+        return bool(self.categories & _SCAN_CATEGORIES)
     
     def is_async(self) -> bool:
         """Check if this is an asynchronous pin."""
-        return PinCategory.ASYNC in self.categories
+        return bool(self.categories & PinCategory.ASYNC)
 
     def is_internal(self) -> bool:
         """Check if this is an internal pin."""
-        return PinCategory.INTERNAL in self.categories
+        return bool(self.categories & PinCategory.INTERNAL)
 
 
 @dataclass
@@ -187,10 +256,24 @@ class Cell:
     power_template: Optional[str] = None
     constraint_template: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Derived per-category / per-direction pin name indexes (rebuilt lazily)
+    _by_category: Dict[int, List[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _by_direction: Dict[str, List[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _function_pins: List[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _pin_order_set: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _category_mask: int = field(default=0, init=False, repr=False, compare=False)
+    _repr_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _output_pin_set: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False, compare=False)
+    # (pin, related_pin, timing_type) keys that passed TimingArcValidator.validate_cell_integration
+    _arc_validation_cache: Set[tuple] = field(default_factory=set, init=False, repr=False, compare=False)
+    _pin_indexes_valid: bool = field(default=False, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate cell data after initialization."""
         self._validate()
+        self._pin_order_set = set(self.pin_order)
+        for pin in self.pins.values():
+            pin._attach(self)
     
     def _validate(self) -> None:
         """
@@ -211,13 +294,17 @@ class Cell:
             if invalid_pins_in_order:
                 raise ValidationError(f"Pin order contains unknown pins: {invalid_pins_in_order}")
         
-        # Validate timing arcs reference valid pins
-        for arc in self.timing_arcs:
-            if arc.pin not in all_pin_names and arc.pin != '-':
+        # Validate timing arcs reference valid pins ('-' means no pin)
+        valid_refs = all_pin_names | {'-'}
+        arc = next(
+            (arc for arc in self.timing_arcs
+             if arc.pin not in valid_refs or arc.related_pin not in valid_refs),
+            None,
+        )
+        if arc is not None:
+            if arc.pin not in valid_refs:
                 raise ValidationError(f"Timing arc references unknown pin: {arc.pin}")
-            
-            if arc.related_pin != '-' and arc.related_pin not in all_pin_names:
-                raise ValidationError(f"Timing arc references unknown related pin: {arc.related_pin}")
+            raise ValidationError(f"Timing arc references unknown related pin: {arc.related_pin}")
     
     def add_pin(self, pin_info: PinInfo) -> None:
         """
@@ -233,14 +320,107 @@ class Cell:
             raise ValidationError(f"Pin '{pin_info.name}' already exists in cell")
         
         self.pins[pin_info.name] = pin_info
+        pin_info._attach(self)
+        self._repr_cache = None
+        self._output_pin_set = None
+        self._arc_validation_cache.clear()
+        if self._pin_indexes_valid:
+            self._index_pin(pin_info)
         
         # Add to pin_order for consistent vector ordering
-        if pin_info.name not in self.pin_order:
+        if pin_info.name not in self._pin_order_set:
             self.pin_order.append(pin_info.name)
+            self._pin_order_set.add(pin_info.name)
             # Update position if not set
             if pin_info.position is None:
                 pin_info.position = len(self.pin_order) - 1
     
+    def add_pins(self, pins: Iterable[PinInfo]) -> None:
+        """
+        Add several pins to the cell at once.
+        
+        Equivalent to calling add_pin for each pin, but duplicates are
+        checked up front and the pin indexes are rebuilt once afterwards.
+        
+        Args:
+            pins: PinInfo objects to add, in pin order
+            
+        Raises:
+            ValidationError: If any pin already exists or is given twice
+        """
+        new_pins = {}
+        for pin_info in pins:
+            if pin_info.name in self.pins or pin_info.name in new_pins:
+                raise ValidationError(f"Pin '{pin_info.name}' already exists in cell")
+            new_pins[pin_info.name] = pin_info
+        
+        self.pins.update(new_pins)
+        pin_order = self.pin_order
+        pin_order_set = self._pin_order_set
+        for name, pin_info in new_pins.items():
+            pin_info._attach(self)
+            if name not in pin_order_set:
+                pin_order.append(name)
+                pin_order_set.add(name)
+                if pin_info.position is None:
+                    pin_info.position = len(pin_order) - 1
+        self._invalidate_pin_indexes()
+    
+    def _invalidate_pin_indexes(self) -> None:
+        """Mark the category/direction indexes stale after a pin mutation."""
+        self._pin_indexes_valid = False
+        self._repr_cache = None
+        self._output_pin_set = None
+        self._arc_validation_cache.clear()
+    
+    def invalidate_arc_validation_cache(self) -> None:
+        """Forget cached arc/pin validation verdicts and the pin indexes.
+        
+        Pin additions, PinInfo.set_direction/add_category/remove_category
+        and set_function/update_functions already do this; call it after
+        assigning a pin's direction, categories or function directly.
+        """
+        self._invalidate_pin_indexes()
+    
+    def _index_pin(self, pin: PinInfo) -> None:
+        """Append a single pin to the category/direction indexes."""
+        categories = pin.categories
+        if categories:
+            self._category_mask |= categories
+            for flag in PIN_CATEGORY_NAMES:
+                if categories & flag:
+                    self._by_category.setdefault(flag, []).append(pin.name)
+        self._by_direction.setdefault(pin.direction, []).append(pin.name)
+        if pin.function and pin.direction in _OUTPUT_LIKE_DIRECTIONS:
+            self._function_pins.append(pin.name)
+    
+    def _ensure_pin_indexes(self) -> None:
+        """Rebuild the category/direction/function indexes in pin order if stale."""
+        if self._pin_indexes_valid:
+            return
+        self._by_category = {}
+        self._by_direction = {}
+        self._category_mask = 0
+        self._function_pins = []
+        for pin in self.pins.values():
+            self._index_pin(pin)
+        self._pin_indexes_valid = True
+    
+    def _has_pins_in(self, categories: int) -> bool:
+        """Check whether any pin carries one of the given category flags."""
+        self._ensure_pin_indexes()
+        return bool(self._category_mask & categories)
+    
+    def _pins_in_category(self, category: int) -> List[str]:
+        """Return the (shared, do not mutate) index list for one category flag."""
+        self._ensure_pin_indexes()
+        return self._by_category.get(category, [])
+    
+    def _pins_in_direction(self, direction: str) -> List[str]:
+        """Return the (shared, do not mutate) index list for one direction."""
+        self._ensure_pin_indexes()
+        return self._by_direction.get(direction, [])
+    
     def get_pin_order(self) -> List[str]:
         """Get the canonical pin ordering for vectors.
         
@@ -271,6 +451,19 @@ class Cell:
             timing_arc.normalize_conditions(self)
         self.timing_arcs.append(timing_arc)
     
+    def add_timing_arcs(self, timing_arcs: Iterable[TimingArc]) -> None:
+        """
+        Add several timing arcs to the cell at once.
+        
+        Args:
+            timing_arcs: TimingArc objects to add
+        """
+        arcs = list(timing_arcs)
+        for timing_arc in arcs:
+            if hasattr(timing_arc, "normalize_conditions"):
+                timing_arc.normalize_conditions(self)
+        self.timing_arcs.extend(arcs)
+    
     def has_any_manual_arcs(self) -> bool:
         """
         Check if the cell has any manually defined timing arcs.
@@ -327,8 +520,14 @@ class Cell:
         Returns:
             Dict containing arc statistics and generation status
         """
-        manual_count = self.get_manual_arc_count()
-        auto_count = self.get_auto_arc_count()
+        # Count both sources in a single pass over the arc list
+        manual_count = auto_count = 0
+        for arc in self.timing_arcs:
+            source = arc.metadata.get('source')
+            if source == 'manual':
+                manual_count += 1
+            elif source == 'auto':
+                auto_count += 1
         total_count = len(self.timing_arcs)
         unknown_count = total_count - manual_count - auto_count
         
@@ -385,10 +584,7 @@ class Cell:
     @property
     def is_sequential(self) -> bool:
         """Check if cell is sequential (has clock pins or enable pins that act as clocks)."""
-
-        if any(pin.is_clock() or pin.is_enable() for pin in self.pins.values()):
-            return True
-        return False
+        return self._has_pins_in(_SEQUENTIAL_CATEGORIES)
     
     @property
     def is_combinational(self) -> bool:
@@ -398,15 +594,14 @@ class Cell:
     @property 
     def is_latch(self) -> bool:
         """Check if cell is a latch."""
-        return any(pin.is_enable() for pin in self.pins.values())
+        return self._has_pins_in(PinCategory.ENABLE)
     
     @property
     def has_async_pins(self) -> bool:
         """Check if cell has asynchronous pins."""
-        return any(pin.is_async() or pin.is_reset() or pin.is_set() 
-                  for pin in self.pins.values())
+        return self._has_pins_in(_ASYNC_CONTROL_CATEGORIES)
     
-    def get_pins_by_category(self, category: str) -> List[str]:
+    def get_pins_by_category(self, category: int) -> List[str]:
         """Get all pins that have a specific category.
         
         Args:
@@ -415,6 +610,9 @@ class Cell:
         Returns:
             List of pin names with the specified category
         """
+        if category in PIN_CATEGORY_NAMES:
+            return self._pins_in_category(category).copy()
+        # Combined masks: preserve pin order across several categories
         return [name for name, pin in self.pins.items() if pin.has_category(category)]
     
     def get_clock_pins(self) -> List[str]:
@@ -423,16 +621,21 @@ class Cell:
 
     def get_clock_positive_pins(self) -> List[str]:
         """Get all positive edge triggered clock pins."""
-        return [name for name, pin in self.pins.items()
-                if pin.is_clock() and not pin.is_negative]
+        pins = self.pins
+        return [name for name in self._pins_in_category(PinCategory.CLOCK)
+                if not pins[name].is_negative]
 
     def get_clock_negative_pins(self) -> List[str]:
         """Get all negative edge triggered clock pins."""
         return self.get_negative_pins(PinCategory.CLOCK)
 
-    def get_negative_pins(self, category: str) -> List[str]:
+    def get_negative_pins(self, category: int) -> List[str]:
         """Get all negative pins of a specific category."""
-        return [name for name, pin in self.pins.items() 
+        pins = self.pins
+        if category in PIN_CATEGORY_NAMES:
+            return [name for name in self._pins_in_category(category)
+                    if pins[name].is_negative]
+        return [name for name, pin in pins.items()
                 if pin.has_category(category) and pin.is_negative]
     
     def get_enable_pins(self) -> List[str]:
@@ -461,7 +664,7 @@ class Cell:
     
     def get_scan_pins(self) -> List[str]:
         """Get all scan-related pins."""
-        return [name for name, pin in self.pins.items() if pin.is_scan()]
+        return self.get_pins_by_category(_SCAN_CATEGORIES)
     
     def get_scan_enable_pins(self) -> List[str]:
         """Get all scan enable pins."""
@@ -473,11 +676,11 @@ class Cell:
     
     def get_input_pins(self) -> List[str]:
         """Get all input pins."""
-        return [name for name, pin in self.pins.items() if pin.direction == 'input']
+        return self._pins_in_direction('input').copy()
     
     def get_output_pins(self) -> List[str]:
         """Get all output pins."""
-        return [name for name, pin in self.pins.items() if pin.direction == 'output']
+        return self._pins_in_direction('output').copy()
 
     def get_outpositive_pins(self) -> List[str]:
         """Get all output pins with positive (non-inverted) logic.
@@ -486,20 +689,37 @@ class Cell:
         accessing ``PinInfo`` directly for new code to avoid relying on the
         legacy "outpositive" terminology.
         """
-        return [name for name, pin in self.pins.items()
-                if pin.direction == 'output' and not pin.is_negative]
+        pins = self.pins
+        return [name for name in self._pins_in_direction('output')
+                if not pins[name].is_negative]
 
     def get_outnegative_pins(self) -> List[str]:
         """Get all output pins with negative (inverted) logic.
 
         See :meth:`get_outpositive_pins` for migration notes.
         """
-        return [name for name, pin in self.pins.items()
-                if pin.direction == 'output' and pin.is_negative]
+        pins = self.pins
+        return [name for name in self._pins_in_direction('output')
+                if pins[name].is_negative]
 
     def get_internal_pins(self) -> List[str]:
         """Get all internal pins."""
         return self.get_pins_by_category(PinCategory.INTERNAL)
+
+    def get_output_and_internal_pin_set(self) -> FrozenSet[str]:
+        """Get output and internal pin names as a set.
+        
+        Timing-arc condition handling treats both kinds as outputs, since
+        neither can be driven directly. The set is cached until the pins
+        change.
+        """
+        pin_set = self._output_pin_set
+        if pin_set is None:
+            self._ensure_pin_indexes()
+            pin_set = self._output_pin_set = frozenset(
+                self._pins_in_direction('output')
+            ).union(self._pins_in_category(PinCategory.INTERNAL))
+        return pin_set
     
     # Function-related convenience methods
     def get_function(self, pin_name: str) -> Optional['LogicFunctionAnalyzer']:
@@ -519,7 +739,7 @@ class Cell:
             raise ValidationError(f"Pin '{pin_name}' not found in cell '{self.name}'")
         
         pin = self.pins[pin_name]
-        if pin.direction not in {'output', 'inout', 'internal'}:
+        if pin.direction not in _OUTPUT_LIKE_DIRECTIONS:
             raise ValidationError(f"Pin '{pin_name}' is not an output pin")
         
         return pin.function
@@ -551,16 +771,16 @@ class Cell:
         Raises:
             ValidationError: If pin doesn't exist or is not an output pin
         """
-        from zlibboost.arc_generation.logic_analyzer import LogicFunctionAnalyzer
-
         if pin_name not in self.pins:
             raise ValidationError(f"Pin '{pin_name}' not found in cell '{self.name}'")
         
         pin = self.pins[pin_name]
-        if pin.direction not in {'output', 'inout', 'internal'}:
+        if pin.direction not in _OUTPUT_LIKE_DIRECTIONS:
             raise ValidationError(f"Pin '{pin_name}' is not an output pin")
         
-        pin.function = LogicFunctionAnalyzer(function)
+        pin.function = _get_analyzer_cls()(function)
+        self._invalidate_pin_indexes()
+        pin._notify_owners()
     
     def get_functions(self) -> Dict[str, 'LogicFunctionAnalyzer']:
         """
@@ -570,11 +790,9 @@ class Cell:
             Dictionary mapping output pin names to their logical function analyzers.
             Only includes pins that have functions defined.
         """
-        functions = {}
-        for pin_name, pin in self.pins.items():
-            if pin.direction in {'output', 'inout', 'internal'} and pin.function:
-                functions[pin_name] = pin.function
-        return functions
+        self._ensure_pin_indexes()
+        pins = self.pins
+        return {name: pins[name].function for name in self._function_pins}
     
     def get_functions_as_strings(self) -> Dict[str, str]:
         """
@@ -584,11 +802,9 @@ class Cell:
             Dictionary mapping output pin names to their logical function strings.
             Only includes pins that have functions defined.
         """
-        functions = {}
-        for pin_name, pin in self.pins.items():
-            if pin.direction in {'output', 'inout', 'internal'} and pin.function:
-                functions[pin_name] = pin.function.original_expr
-        return functions
+        self._ensure_pin_indexes()
+        pins = self.pins
+        return {name: pins[name].function.original_expr for name in self._function_pins}
     
     def update_functions(self, functions: Dict[str, str]) -> None:
         """
@@ -600,16 +816,29 @@ class Cell:
         Raises:
             ValidationError: If any pin doesn't exist or is not an output pin
         """
-        for pin_name, function in functions.items():
-            self.set_function(pin_name, function)
+        analyzer_cls = _get_analyzer_cls()
+        pins = self.pins
+        updated = []
+        try:
+            for pin_name, function in functions.items():
+                pin = pins.get(pin_name)
+                if pin is None:
+                    raise ValidationError(f"Pin '{pin_name}' not found in cell '{self.name}'")
+                if pin.direction not in _OUTPUT_LIKE_DIRECTIONS:
+                    raise ValidationError(f"Pin '{pin_name}' is not an output pin")
+                pin.function = analyzer_cls(function)
+                updated.append(pin)
+        finally:
+            # Functions set before a failure stay applied, as with set_function
+            self._invalidate_pin_indexes()
+            for pin in updated:
+                pin._notify_owners()
     
     def set_next_state_function(self, pin_name: str, function: str) -> None:
         """Set the next state function for the cell."""
-        from zlibboost.arc_generation.logic_analyzer import LogicFunctionAnalyzer
-        
         # Only add the pin if it doesn't already exist
         if pin_name not in self.pins:
-            self.add_pin(PinInfo(name=pin_name, direction='internal', categories={PinCategory.INTERNAL}))
+            self.add_pin(PinInfo(name=pin_name, direction='internal', categories=PinCategory.INTERNAL))
             self.set_function(pin_name, function)
         else:
             # Pin exists - check if it's an internal pin
@@ -625,13 +854,20 @@ class Cell:
         """String representation of cell."""
         return (
             f"Cell(name='{self.name}', pins={len(self.pins)}, "
-            f"timing_arcs={len(self.timing_arcs)}"
+            f"timing_arcs={len(self.timing_arcs)})"
         )
 
     def __repr__(self) -> str:
-        """Detailed string representation of cell."""
-        return (
-            f"Cell(name='{self.name}', pins={list(self.pins.keys())}, "
-            f"timing_arcs={len(self.timing_arcs)}, "
-            f"is_sequential={self.is_sequential}"
-        )
+        """Detailed string representation of cell.
+        
+        The pin-dependent prefix is cached until the pins change, so repeated
+        logging does not rebuild the pin name list every time.
+        """
+        cache = self._repr_cache
+        if cache is None or cache[0] != self.name:
+            cache = self._repr_cache = (
+                self.name,
+                f"Cell(name='{self.name}', pins={list(self.pins)}, ",
+                f"is_sequential={self.is_sequential})",
+            )
+        return f"{cache[1]}timing_arcs={len(self.timing_arcs)}, {cache[2]}"
@@ -5,14 +5,89 @@ This module defines the Template class for managing timing templates
 used in delay, power, and constraint characterization.
 """
 
-from typing import List, Dict, Any, Optional
+import bisect
+from enum import IntEnum
+from typing import Any, ClassVar, Dict, Iterable, List, NamedTuple, Optional, Sequence
 from dataclasses import dataclass, field
 import numpy as np
 
 from zlibboost.core.exceptions import ValidationError
 
 
-@dataclass
+class TemplateType(IntEnum):
+    """Enumeration of template types (values double as compact type codes)."""
+    DELAY = 0
+    POWER = 1
+    CONSTRAINT = 2
+
+    @property
+    def label(self) -> str:
+        """Library string form of the type ('delay', 'power', 'constraint')."""
+        return self.name.lower()
+
+    @classmethod
+    def from_string(cls, value: str) -> 'TemplateType':
+        """Look up a template type by its library string form.
+
+        Raises:
+            ValidationError: If the string is not a known template type
+        """
+        try:
+            return _TEMPLATE_TYPES_BY_LABEL[value]
+        except (KeyError, TypeError):
+            raise ValidationError(
+                f"Invalid template type '{value}'. "
+                f"Must be one of: {set(_TEMPLATE_TYPES_BY_LABEL)}"
+            )
+
+
+_TEMPLATE_TYPES_BY_LABEL: Dict[str, TemplateType] = {t.label: t for t in TemplateType}
+
+# Entries kept per template by the interpolate_indices memo before it is reset
+_INTERP_CACHE_LIMIT = 4096
+
+
+def _short_repr(values: Sequence[float], threshold: int = 6) -> str:
+    """Format an index axis, eliding the middle of long axes for logging."""
+    if len(values) <= threshold:
+        return repr(list(values))
+    return f"[{values[0]}, {values[1]}, ..., {values[-1]}] (n={len(values)})"
+
+
+def _reciprocal_widths(values: np.ndarray) -> np.ndarray:
+    """Return 1 / (values[i+1] - values[i]) for each index point.
+
+    The result has one entry per point: the last point (which has no
+    interval above it) and zero-width steps from repeated points get 0.0.
+    Lookups never interpolate across either, so those entries only ever
+    multiply a zero offset.
+    """
+    inv = np.zeros_like(values)
+    widths = np.diff(values)
+    np.divide(1.0, widths, out=inv[:-1], where=widths != 0)
+    return inv
+
+
+def _check_sorted_nonneg(values: np.ndarray) -> Optional[str]:
+    """Check an index axis is non-decreasing and non-negative.
+
+    Once the axis is known to be sorted only its first element needs the
+    sign test, so this costs one diff/reduction instead of three passes.
+
+    Returns:
+        None if the axis is valid, otherwise the problem description
+    """
+    if values.size == 0:
+        return None
+    # ``>= 0`` (rather than ``< 0``) so that NaN steps are rejected too
+    if not (np.diff(values) >= 0).all():
+        return "must be in non-decreasing order"
+    if values[0] < 0:
+        return "cannot be negative"
+    return None
+
+
+@dataclass(slots=True)
 class Template:
     """
     Represents a timing template with index dimensions and metadata.
@@ -23,6 +98,7 @@ class Template:
     Attributes:
         name: Template name (e.g., 'delay_template_7x7')
         template_type: Type of template ('delay', 'power', 'constraint')
+        type_code: TemplateType matching template_type (derived)
         index_1: First dimension index values (input transition time or constraint)
         index_2: Second dimension index values (output load capacitance)
         metadata: Additional template metadata
@@ -33,6 +109,25 @@ class Template:
     index_2: List[float]
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    # Keys from_dict requires (class constant, not a dataclass field)
+    _REQUIRED_FIELDS: ClassVar[frozenset] = frozenset(('name', 'type', 'index_1', 'index_2'))
+    
+    type_code: TemplateType = field(init=False, repr=False, compare=False)
+    # Validated float64 copies of the index axes, reused by lookups
+    _index_1_np: np.ndarray = field(init=False, repr=False, compare=False)
+    _index_2_np: np.ndarray = field(init=False, repr=False, compare=False)
+    # Plain-float tuples for scalar lookups (bisect avoids numpy call overhead)
+    _index_1_tuple: tuple = field(init=False, repr=False, compare=False)
+    _index_2_tuple: tuple = field(init=False, repr=False, compare=False)
+    # Reciprocal interval widths, so interpolation weights need no division
+    _inv_dx_1: np.ndarray = field(init=False, repr=False, compare=False)
+    _inv_dx_2: np.ndarray = field(init=False, repr=False, compare=False)
+    _inv_dx_1_tuple: tuple = field(init=False, repr=False, compare=False)
+    _inv_dx_2_tuple: tuple = field(init=False, repr=False, compare=False)
+    # Per-axis interpolate_indices memos, keyed by the query value
+    _interp_cache_1: Dict[float, tuple] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _interp_cache_2: Dict[float, tuple] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate template data after initialization."""
         self._validate()
@@ -47,15 +142,13 @@ class Template:
         if not self.name:
             raise ValidationError("Template name cannot be empty")
         
+        if isinstance(self.template_type, TemplateType):
+            self.template_type = self.template_type.label
+        
         if not self.template_type:
             raise ValidationError("Template type cannot be empty")
         
-        valid_types = {'delay', 'power', 'constraint'}
-        if self.template_type not in valid_types:
-            raise ValidationError(
-                f"Invalid template type '{self.template_type}'. "
-                f"Must be one of: {valid_types}"
-            )
+        self.type_code = TemplateType.from_string(self.template_type)
         
         if not self.index_1:
             raise ValidationError("index_1 cannot be empty")
@@ -63,17 +156,16 @@ class Template:
         if not self.index_2:
             if not self.metadata.get("allow_empty_index_2"):
                 raise ValidationError("index_2 cannot be empty")
+            index_2_array = np.empty(0, dtype=float)
         else:
             try:
                 index_2_array = np.array(self.index_2, dtype=float)
             except (ValueError, TypeError) as e:
                 raise ValidationError(f"Index values must be numeric: {e}")
 
-            if not np.all(index_2_array[:-1] <= index_2_array[1:]):
-                raise ValidationError("index_2 values must be in non-decreasing order")
-
-            if np.any(index_2_array < 0):
-                raise ValidationError("index_2 values cannot be negative")
+            problem = _check_sorted_nonneg(index_2_array)
+            if problem:
+                raise ValidationError(f"index_2 values {problem}")
 
         # Validate index values are numeric and sorted
         try:
@@ -81,11 +173,53 @@ class Template:
         except (ValueError, TypeError) as e:
             raise ValidationError(f"Index values must be numeric: {e}")
 
-        if not np.all(index_1_array[:-1] <= index_1_array[1:]):
-            raise ValidationError("index_1 values must be in non-decreasing order")
+        problem = _check_sorted_nonneg(index_1_array)
+        if problem:
+            raise ValidationError(f"index_1 values {problem}")
 
-        if np.any(index_1_array < 0):
-            raise ValidationError("index_1 values cannot be negative")
+        self._build_caches(index_1_array, index_2_array)
+    
+    def _build_caches(self, index_1_array: np.ndarray, index_2_array: np.ndarray) -> None:
+        """Derive the lookup caches from validated float64 index axes."""
+        self._index_1_np = index_1_array
+        self._index_2_np = index_2_array
+        self._index_1_tuple = tuple(index_1_array.tolist())
+        self._index_2_tuple = tuple(index_2_array.tolist())
+        self._inv_dx_1 = _reciprocal_widths(index_1_array)
+        self._inv_dx_2 = _reciprocal_widths(index_2_array)
+        self._inv_dx_1_tuple = tuple(self._inv_dx_1.tolist())
+        self._inv_dx_2_tuple = tuple(self._inv_dx_2.tolist())
+    
+    @classmethod
+    def _unsafe_new(
+        cls,
+        name: str,
+        template_type: str,
+        index_1: List[float],
+        index_2: List[float],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> 'Template':
+        """
+        Build a Template from already-validated data without re-validating.
+        
+        Only for sources that already enforce every rule of _validate (e.g.
+        rows of a TemplateTable, whose bulk validation mirrors it); the
+        public constructor remains the validating path. The lookup caches
+        are still populated.
+        """
+        template = object.__new__(cls)
+        template.name = name
+        template.template_type = template_type
+        template.index_1 = index_1
+        template.index_2 = index_2
+        template.metadata = {} if metadata is None else metadata
+        template.type_code = _TEMPLATE_TYPES_BY_LABEL[template_type]
+        template._interp_cache_1 = {}
+        template._interp_cache_2 = {}
+        template._build_caches(
+            np.asarray(index_1, dtype=float), np.asarray(index_2, dtype=float)
+        )
+        return template
     
     @property
     def dimensions(self) -> tuple[int, int]:
@@ -105,17 +239,21 @@ class Template:
             dimension: 1 for index_1, 2 for index_2
             
         Returns:
-            Tuple of (min_value, max_value)
+            Tuple of (min_value, max_value). Axes are validated to be
+            non-decreasing, so these are simply the first and last points.
             
         Raises:
-            ValueError: If dimension is not 1 or 2
+            ValueError: If dimension is not 1 or 2, or the axis is empty
         """
         if dimension == 1:
-            return min(self.index_1), max(self.index_1)
+            indices = self._index_1_tuple
         elif dimension == 2:
-            return min(self.index_2), max(self.index_2)
+            indices = self._index_2_tuple
         else:
             raise ValueError("Dimension must be 1 or 2")
+        if not indices:
+            raise ValueError(f"index_{dimension} is empty")
+        return indices[0], indices[-1]
     
     def interpolate_indices(self, value: float, dimension: int) -> tuple[int, int, float]:
         """
@@ -131,48 +269,158 @@ class Template:
             
         Raises:
             ValueError: If dimension is invalid or value is out of range
+        
+        Results are memoized per template, since the same transition/load
+        values recur across every arc that shares the template.
         """
         if dimension == 1:
-            indices = self.index_1
+            cache = self._interp_cache_1
         elif dimension == 2:
-            indices = self.index_2
+            cache = self._interp_cache_2
         else:
             raise ValueError("Dimension must be 1 or 2")
         
-        indices_array = np.array(indices)
+        result = cache.get(value)
+        if result is None:
+            result = self._lookup_indices(value, dimension)
+            if len(cache) >= _INTERP_CACHE_LIMIT:
+                cache.clear()
+            cache[value] = result
+        return result
+    
+    def _lookup_indices(self, value: float, dimension: int) -> tuple[int, int, float]:
+        """Uncached implementation of :meth:`interpolate_indices`."""
+        if dimension == 1:
+            indices = self._index_1_tuple
+            inv_dx = self._inv_dx_1_tuple
+        elif dimension == 2:
+            indices = self._index_2_tuple
+            inv_dx = self._inv_dx_2_tuple
+        else:
+            raise ValueError("Dimension must be 1 or 2")
         
         # Check bounds
-        if value < indices_array[0] or value > indices_array[-1]:
+        if value < indices[0] or value > indices[-1]:
             raise ValueError(
-                f"Value {value} is out of range [{indices_array[0]}, {indices_array[-1]}]"
+                f"Value {value} is out of range [{indices[0]}, {indices[-1]}]"
             )
         
         # Find interpolation indices
-        upper_idx = np.searchsorted(indices_array, value, side='right')
+        upper_idx = bisect.bisect_right(indices, value)
         
         if upper_idx == 0:
             # Value equals first index
             return 0, 0, 0.0
-        elif upper_idx == len(indices_array):
+        elif upper_idx == len(indices):
             # Value equals last index
-            return len(indices_array) - 1, len(indices_array) - 1, 0.0
+            return len(indices) - 1, len(indices) - 1, 0.0
         else:
             # Interpolation needed
             lower_idx = upper_idx - 1
-            lower_val = indices_array[lower_idx]
-            upper_val = indices_array[upper_idx]
-            weight = (value - lower_val) / (upper_val - lower_val)
+            weight = (value - indices[lower_idx]) * inv_dx[lower_idx]
             return lower_idx, upper_idx, weight
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert template to dictionary representation."""
+    def interpolate_indices_clamped(self, value: float, dimension: int) -> tuple[int, int, float]:
+        """
+        Unchecked variant of :meth:`interpolate_indices` for hot loops.
+        
+        Values outside the axis are clamped to its end points instead of
+        raising, and the result always brackets a real interval
+        (``upper == lower + 1``), so the value at the last point comes back
+        as ``(n - 2, n - 1, 1.0)`` rather than ``(n - 1, n - 1, 0.0)``. Both
+        describe the same interpolated point.
+        
+        Args:
+            value: Value to interpolate
+            dimension: 1 for index_1, 2 for index_2
+            
+        Returns:
+            Tuple of (lower_index, upper_index, weight)
+            
+        Raises:
+            ValueError: If dimension is invalid
+        """
+        if dimension == 1:
+            indices = self._index_1_tuple
+            inv_dx = self._inv_dx_1_tuple
+        elif dimension == 2:
+            indices = self._index_2_tuple
+            inv_dx = self._inv_dx_2_tuple
+        else:
+            raise ValueError("Dimension must be 1 or 2")
+        
+        last = len(indices) - 1
+        if last < 1:
+            return 0, 0, 0.0
+        value = min(max(value, indices[0]), indices[last])
+        upper_idx = min(max(bisect.bisect_right(indices, value), 1), last)
+        lower_idx = upper_idx - 1
+        return lower_idx, upper_idx, (value - indices[lower_idx]) * inv_dx[lower_idx]
+    
+    def interpolate_indices_batch(
+        self, values: np.ndarray, dimension: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized :meth:`interpolate_indices` for many values at once.
+        
+        Args:
+            values: Array-like of values to interpolate
+            dimension: 1 for index_1, 2 for index_2
+            
+        Returns:
+            Tuple of (lower_indices, upper_indices, weights) arrays, element-wise
+            identical to calling interpolate_indices on each in-range value
+            
+        Raises:
+            ValueError: If dimension is invalid or any value is out of range.
+                NaN counts as out of range here (as in Waveform's batch
+                path), whereas the scalar lookup lets it through.
+        """
+        if dimension == 1:
+            indices_array = self._index_1_np
+            inv_dx = self._inv_dx_1
+        elif dimension == 2:
+            indices_array = self._index_2_np
+            inv_dx = self._inv_dx_2
+        else:
+            raise ValueError("Dimension must be 1 or 2")
+        
+        values = np.asarray(values, dtype=float)
+        # Written as a negated in-range test so that NaN is rejected too
+        out_of_range = ~((values >= indices_array[0]) & (values <= indices_array[-1]))
+        if out_of_range.any():
+            value = values[out_of_range][0]
+            raise ValueError(
+                f"Value {value} is out of range [{indices_array[0]}, {indices_array[-1]}]"
+            )
+        
+        last = len(indices_array) - 1
+        upper = np.searchsorted(indices_array, values, side='right')
+        at_end = upper > last
+        upper[at_end] = last
+        lower = np.where(at_end, last, upper - 1)
+        
+        # At the last point inv_dx is 0.0, so no special case is needed
+        weights = (values - indices_array[lower]) * inv_dx[lower]
+        return lower, upper, weights
+    
+    def to_dict(self, *, copy: bool = False) -> Dict[str, Any]:
+        """
+        Convert template to dictionary representation.
+        
+        Args:
+            copy: If True, copy the index lists and metadata. By default the
+                template's own objects are returned, so callers that only
+                serialize the result pay no allocation; they must not
+                mutate them.
+        """
         return {
             'name': self.name,
             'type': self.template_type,
-            'index_1': self.index_1.copy(),
-            'index_2': self.index_2.copy(),
+            'index_1': self.index_1.copy() if copy else self.index_1,
+            'index_2': self.index_2.copy() if copy else self.index_2,
             'dimensions': self.dimensions,
-            'metadata': self.metadata.copy()
+            'metadata': self.metadata.copy() if copy else self.metadata
         }
     
     @classmethod
@@ -189,17 +437,16 @@ class Template:
         Raises:
             ValidationError: If required fields are missing
         """
-        required_fields = {'name', 'type', 'index_1', 'index_2'}
-        missing_fields = required_fields - set(data.keys())
+        missing_fields = cls._REQUIRED_FIELDS.difference(data)
         if missing_fields:
-            raise ValidationError(f"Missing required fields: {missing_fields}")
+            raise ValidationError(f"Missing required fields: {set(missing_fields)}")
         
         return cls(
             name=data['name'],
             template_type=data['type'],
             index_1=list(data['index_1']),
             index_2=list(data['index_2']),
-            metadata=data.get('metadata', {})
+            metadata=dict(data.get('metadata', {}))
         )
     
     def __str__(self) -> str:
@@ -213,6 +460,194 @@ class Template:
         """Detailed string representation of template."""
         return (
             f"Template(name='{self.name}', template_type='{self.template_type}', "
-            f"index_1={self.index_1}, index_2={self.index_2}, "
+            f"index_1={_short_repr(self.index_1)}, index_2={_short_repr(self.index_2)}, "
             f"metadata={self.metadata})"
         )
+
+
+class TemplateRow(NamedTuple):
+    """Lightweight read-only view of one template in a TemplateTable."""
+    name: str
+    template_type: str
+    index_1: np.ndarray
+    index_2: np.ndarray
+
+
+class TemplateTable:
+    """
+    Column-oriented (structure-of-arrays) storage for many templates.
+    
+    Names are kept in a list, template types as a uint8 code column, and the
+    ragged index axes as one flat numeric buffer per axis plus CSR-style
+    offsets. Row ``i`` of index_1 is ``index_1_values[index_1_offsets[i]:
+    index_1_offsets[i + 1]]``. All rows are validated together at
+    construction, which is much cheaper than validating Template objects one
+    by one when loading large libraries.
+    
+    Buffers default to float64. Passing ``dtype=np.float32`` halves their
+    size for bulk scans that do not need full precision; values read back
+    from such a table carry float32 rounding.
+    
+    Attributes:
+        names: Template names, in row order
+        type_codes: TemplateType value per row
+        index_1_values: Concatenated index_1 axes
+        index_1_offsets: Row boundaries into index_1_values (length rows + 1)
+        index_2_values: Concatenated index_2 axes
+        index_2_offsets: Row boundaries into index_2_values (length rows + 1)
+    """
+    
+    def __init__(
+        self,
+        names: Sequence[str],
+        template_types: Sequence[str],
+        index_1: Sequence[Sequence[float]],
+        index_2: Sequence[Sequence[float]],
+        dtype: Any = np.float64,
+    ):
+        """
+        Build the table from parallel per-row sequences.
+        
+        Raises:
+            ValidationError: If the columns are inconsistent or any row is invalid
+        """
+        if not (len(names) == len(template_types) == len(index_1) == len(index_2)):
+            raise ValidationError("TemplateTable columns must have the same length")
+        
+        self.names: List[str] = list(names)
+        self._row_by_name = {name: row for row, name in enumerate(self.names)}
+        if len(self._row_by_name) != len(self.names):
+            raise ValidationError("TemplateTable contains duplicate template names")
+        
+        self.type_codes = np.fromiter(
+            (TemplateType.from_string(t) for t in template_types),
+            dtype=np.uint8,
+            count=len(self.names),
+        )
+        
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValidationError(f"TemplateTable dtype must be float32 or float64, got {dtype}")
+        self.index_1_values, self.index_1_offsets = self._pack(index_1, dtype)
+        self.index_2_values, self.index_2_offsets = self._pack(index_2, dtype)
+        self._validate()
+    
+    @classmethod
+    def from_templates(
+        cls, templates: Iterable[Template], dtype: Any = np.float64
+    ) -> 'TemplateTable':
+        """Build a table from existing Template objects."""
+        templates = list(templates)
+        return cls(
+            names=[t.name for t in templates],
+            template_types=[t.template_type for t in templates],
+            index_1=[t.index_1 for t in templates],
+            index_2=[t.index_2 for t in templates],
+            dtype=dtype,
+        )
+    
+    @staticmethod
+    def _pack(
+        rows: Sequence[Sequence[float]], dtype: np.dtype
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Concatenate ragged rows into a flat buffer plus offsets."""
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(row) for row in rows])
+        try:
+            values = np.fromiter(
+                (v for row in rows for v in row), dtype=dtype, count=int(offsets[-1])
+            )
+        except (ValueError, TypeError) as e:
+            raise ValidationError(f"Index values must be numeric: {e}")
+        return values, offsets
+    
+    def _validate(self) -> None:
+        """
+        Validate every row at once, with the same rules as Template._validate.
+        
+        Raises:
+            ValidationError: If any name or index_1 row is empty, or any axis
+                is not in non-decreasing order or starts below zero
+        """
+        for name in self.names:
+            if not name:
+                raise ValidationError("Template name cannot be empty")
+        
+        if len(self.names) and not np.all(np.diff(self.index_1_offsets) > 0):
+            row = int(np.argmin(np.diff(self.index_1_offsets) > 0))
+            raise ValidationError(f"Template '{self.names[row]}': index_1 cannot be empty")
+        
+        for axis, values, offsets in (
+            ('index_1', self.index_1_values, self.index_1_offsets),
+            ('index_2', self.index_2_values, self.index_2_offsets),
+        ):
+            if values.size == 0:
+                continue
+            # ``>= 0`` (rather than ``< 0``) so that NaN steps are rejected
+            # too, as in _check_sorted_nonneg; differences that straddle two
+            # rows are ignored
+            decreasing = ~(np.diff(values) >= 0)
+            starts = offsets[1:-1]
+            decreasing[starts[(starts > 0) & (starts < values.size)] - 1] = False
+            if decreasing.any():
+                row = self._row_of(offsets, int(np.argmax(decreasing)))
+                raise ValidationError(
+                    f"Template '{self.names[row]}': "
+                    f"{axis} values must be in non-decreasing order"
+                )
+            # Rows are sorted now, so only their first values need the sign test
+            firsts = offsets[:-1][np.diff(offsets) > 0]
+            negative = values[firsts] < 0
+            if negative.any():
+                row = self._row_of(offsets, int(firsts[np.argmax(negative)]))
+                raise ValidationError(
+                    f"Template '{self.names[row]}': {axis} values cannot be negative"
+                )
+    
+    @staticmethod
+    def _row_of(offsets: np.ndarray, position: int) -> int:
+        """Map a position in a flat value buffer back to its row."""
+        return int(np.searchsorted(offsets, position, side='right')) - 1
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._row_by_name
+    
+    def __getitem__(self, key) -> TemplateRow:
+        """Return a view of one row, by position or by template name."""
+        row = self._row_by_name[key] if isinstance(key, str) else key
+        if row < 0:
+            row += len(self.names)
+        i1, i2 = self.index_1_offsets, self.index_2_offsets
+        return TemplateRow(
+            name=self.names[row],
+            template_type=TemplateType(self.type_codes[row]).label,
+            index_1=self.index_1_values[i1[row]:i1[row + 1]],
+            index_2=self.index_2_values[i2[row]:i2[row + 1]],
+        )
+    
+    def rows_of_type(self, template_type: str) -> np.ndarray:
+        """Return the row numbers of all templates with the given type."""
+        return np.flatnonzero(self.type_codes == TemplateType.from_string(template_type))
+    
+    def to_template(self, key) -> Template:
+        """Materialize one row as a full Template object.
+        
+        _validate applies Template._validate's rules to every row when the
+        table is built (non-empty name, known type, non-empty index_1,
+        sorted non-negative axes that reject NaN steps), so this skips
+        Template's per-instance validation.
+        """
+        row = self[key]
+        return Template._unsafe_new(
+            name=row.name,
+            template_type=row.template_type,
+            index_1=row.index_1.tolist(),
+            index_2=row.index_2.tolist(),
+            metadata={"allow_empty_index_2": True} if row.index_2.size == 0 else {},
+        )
+    
+    def __repr__(self) -> str:
+        return f"TemplateTable(rows={len(self.names)})"
@@ -7,12 +7,18 @@ that represent timing relationships between cell pins.
 
 from __future__ import annotations
 
-from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING
+import io
+import sys
+from typing import Dict, Any, FrozenSet, Iterable, Optional, List, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .cell import Cell
 from dataclasses import dataclass, field
 from enum import Enum
+from time import time as _wall_time
+from types import MappingProxyType
+
+import numpy as np
 
 from zlibboost.core.exceptions import ValidationError
 
@@ -63,11 +69,110 @@ class TransitionDirection(Enum):
     FALL = "fall"
 
 
-ALL_TIMING_TYPES = {e.value for e in TimingType}
-ALL_TABLE_TYPES = {e.value for e in TableType}
-ALL_PIN_DIRECTIONS = {e.value for e in PinDirection}
-ALL_TRANSITION_DIRECTIONS = {e.value for e in TransitionDirection}
-@dataclass
+ALL_TIMING_TYPES = frozenset(e.value for e in TimingType)
+ALL_TABLE_TYPES = frozenset(e.value for e in TableType)
+ALL_PIN_DIRECTIONS = frozenset(e.value for e in PinDirection)
+ALL_TRANSITION_DIRECTIONS = frozenset(e.value for e in TransitionDirection)
+_OUTPUT_LIKE_DIRECTIONS = frozenset({"output", "inout"})
+_BINARY_COND_VALUES = frozenset({"0", "1"})
+
+# Short timing-type labels used by TimingArc.print_compact()
+_TYPE_ABBREV: Dict[str, str] = {
+    "combinational": "COMB",
+    "rising_edge": "RISE",
+    "falling_edge": "FALL",
+    "setup_rising": "SETUP_R",
+    "setup_falling": "SETUP_F",
+    "hold_rising": "HOLD_R",
+    "hold_falling": "HOLD_F",
+    "recovery_rising": "RECOV_R",
+    "recovery_falling": "RECOV_F",
+    "removal_rising": "REMOV_R",
+    "removal_falling": "REMOV_F",
+    "min_pulse_width": "MPW",
+    "hidden": "HIDDEN",
+    "leakage_power": "LEAK",
+}
+
+# Closing rule of TimingArc.print_details()
+_DETAILS_FOOTER = "└" + "─" * 59
+
+# Result tables addressable through TimingArc.values_array()
+_VALUE_TABLE_FIELDS: Dict[str, str] = {
+    "delay": "delay_values",
+    "transition": "transition_values",
+    "power": "power_values",
+    "constraint": "constraint_values",
+    "mpw": "mpw_values",
+}
+
+
+# Resolved on first use; timing_arc_validator imports this module at load
+# time, so importing it here at module level would be circular.
+_TimingArcValidator = None
+
+
+def _get_validator_cls():
+    """Import TimingArcValidator once and cache it at module level."""
+    global _TimingArcValidator
+    if _TimingArcValidator is None:
+        from .timing_arc_validator import TimingArcValidator
+        _TimingArcValidator = TimingArcValidator
+    return _TimingArcValidator
+
+
+def _table_shape(values: Any) -> Optional[Tuple[int, int]]:
+    """Return ``(rows, cols)`` of a nested-list or ndarray table, None if empty."""
+    if values is None or len(values) == 0:
+        return None
+    first = values[0]
+    return len(values), (len(first) if first is not None else 0)
+
+# Arc-kind bits cached per instance in TimingArc._kind_flags
+_KIND_HIDDEN = 1 << 0
+_KIND_CONSTRAINT = 1 << 1
+_KIND_DELAY = 1 << 2
+_KIND_POWER = 1 << 3
+_KIND_TRANSITION = 1 << 4
+
+_TIMING_KIND_FLAGS: Dict[str, int] = {
+    TimingType.HIDDEN.value: _KIND_HIDDEN,
+    TimingType.COMBINATIONAL.value: _KIND_DELAY,
+    TimingType.RISING_EDGE.value: _KIND_DELAY,
+    TimingType.FALLING_EDGE.value: _KIND_DELAY,
+    TimingType.SETUP_RISING.value: _KIND_CONSTRAINT,
+    TimingType.SETUP_FALLING.value: _KIND_CONSTRAINT,
+    TimingType.HOLD_RISING.value: _KIND_CONSTRAINT,
+    TimingType.HOLD_FALLING.value: _KIND_CONSTRAINT,
+    TimingType.RECOVERY_RISING.value: _KIND_CONSTRAINT,
+    TimingType.RECOVERY_FALLING.value: _KIND_CONSTRAINT,
+    TimingType.REMOVAL_RISING.value: _KIND_CONSTRAINT,
+    TimingType.REMOVAL_FALLING.value: _KIND_CONSTRAINT,
+    TimingType.MIN_PULSE_WIDTH.value: _KIND_CONSTRAINT,
+}
+_TABLE_KIND_FLAGS: Dict[str, int] = {
+    TableType.RISE_POWER.value: _KIND_POWER,
+    TableType.FALL_POWER.value: _KIND_POWER,
+    TableType.RISE_TRANSITION.value: _KIND_TRANSITION,
+    TableType.FALL_TRANSITION.value: _KIND_TRANSITION,
+}
+
+# Canonical "0"/"1" spelling for the literal condition values accepted in
+# condition dictionaries. Exact-case keys avoid the lower() call for the
+# common spellings.
+_COND_VALUE_MAP: Dict[str, str] = {
+    "0": "0",
+    "1": "1",
+    "true": "1",
+    "false": "0",
+    "high": "1",
+    "low": "0",
+    "True": "1",
+    "False": "0",
+}
+
+
+@dataclass(slots=True)
 class TimingArc:
     """
     Represents a timing arc between two pins in a cell.
@@ -85,7 +190,8 @@ class TimingArc:
         timing_type: Type of timing arc
         table_type: Type of timing table
         condition: Timing condition expression (auto-generated from condition_dict)
-        condition_dict: Timing condition as dictionary {pin_name: value}
+        condition_dict: Timing condition as dictionary {pin_name: value},
+            kept ordered by pin name (assign through set_condition_dict)
         metadata: Additional arc metadata
 
         # Simulation result fields
@@ -97,7 +203,8 @@ class TimingArc:
         input_capacitance: Input capacitance value
 
         # Simulation metadata
-        simulation_metadata: Additional simulation information (PVT conditions, etc.)
+        simulation_metadata: Additional simulation information (PVT conditions, etc.);
+            None until first written, see ensure_simulation_metadata()
         is_simulated: Flag indicating if this arc has been simulated
     """
     pin: str
@@ -123,13 +230,53 @@ class TimingArc:
     input_capacitance: Optional[float] = None
 
     # Simulation metadata
-    simulation_metadata: Dict[str, Any] = field(default_factory=dict)
+    simulation_metadata: Optional[Dict[str, Any]] = None
     is_simulated: bool = False
+
+    # Memoized get_arc_key() result; cleared by invalidate_key()
+    _cached_key: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # _KIND_* bits derived from timing_type/table_type
+    _kind_flags: int = field(default=0, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         self._validate()
+        # These fields repeat a handful of values across every arc in a
+        # library; interning shares one string object per value.
+        intern = sys.intern
+        self.pin = intern(self.pin)
+        self.timing_type = intern(self.timing_type)
+        self.table_type = intern(self.table_type)
+        if type(self.related_pin) is str:
+            self.related_pin = intern(self.related_pin)
+        if type(self.pin_direction) is str:
+            self.pin_direction = intern(self.pin_direction)
+        if type(self.pin_transition) is str:
+            self.pin_transition = intern(self.pin_transition)
+        if type(self.related_transition) is str:
+            self.related_transition = intern(self.related_transition)
+        self._update_kind_flags()
+        if self.condition_dict and len(self.condition_dict) > 1:
+            self.set_condition_dict(self.condition_dict)
+
+    def _update_kind_flags(self) -> None:
+        self._kind_flags = (
+            _TIMING_KIND_FLAGS.get(self.timing_type, 0)
+            | _TABLE_KIND_FLAGS.get(self.table_type, 0)
+        )
+
+
 
+    def set_condition_dict(self, conditions: Dict[str, str]) -> None:
+        """设置condition_dict，并按引脚名排序保存
 
+        condition字符串按引脚名排序输出；排序在写入时完成一次，
+        读取方可直接按插入顺序遍历。
+
+        Args:
+            conditions: 条件字典 {pin_name: value}
+        """
+        self.condition_dict = dict(sorted(conditions.items()))
+        self._cached_key = None
 
     def reconstruct_condition(self):
         """从condition_dict重构condition字符串
@@ -137,16 +284,15 @@ class TimingArc:
         Returns:
             str: condition字符串，如 "A*!B"
         """
+        self._cached_key = None
         if not self.condition_dict:
             self.condition = ""
             return
         
-        # Sort pins alphabetically for consistent output
-        sorted_pins = sorted(self.condition_dict.keys())
+        # condition_dict is kept sorted by pin name
         terms = []
         
-        for pin in sorted_pins:
-            value = self.condition_dict[pin]
+        for pin, value in self.condition_dict.items():
             if value == "1":
                 terms.append(pin)
             elif value == "0":
@@ -190,34 +336,68 @@ class TimingArc:
         """
 
         inputs, outputs = self._partition_conditions(cell)
-        components = dict(inputs)
-        if include_outputs:
-            merged_outputs = outputs
-            if not include_internal:
-                internal_pins: set[str] = set()
-                if cell is not None:
-                    try:
-                        internal_pins.update(cell.get_internal_pins())
-                    except Exception:  # pragma: no cover - defensive guard
-                        pass
-                else:
-                    # Fallback heuristic for legacy-generated names when cell context
-                    # is unavailable. This keeps behaviour stable in older tests.
-                    internal_pins = {pin for pin in outputs if pin.endswith("_state")}
-
-                if internal_pins:
-                    merged_outputs = {
-                        pin: value
-                        for pin, value in outputs.items()
-                        if pin not in internal_pins
-                    }
-            components.update(merged_outputs)
+        if not include_outputs:
+            return self._cond_str_inputs_only(inputs)
+        if include_internal:
+            return self._cond_str_with_outputs(inputs, outputs)
+        return self._cond_str_with_outputs_no_internal(inputs, outputs, cell)
+
+    # Specialised bodies of condition_string(), one per option combination.
+    # Callers that know their options up front can skip the dispatch.
+
+    @staticmethod
+    def _cond_str_inputs_only(inputs: Dict[str, str]) -> str:
+        # Inputs follow condition_dict order, which is already sorted
+        return TimingArc._format_condition(inputs, presorted=True)
+
+    @staticmethod
+    def _cond_str_with_outputs(
+        inputs: Dict[str, str], outputs: Dict[str, str]
+    ) -> str:
+        if not outputs:
+            return TimingArc._format_condition(inputs, presorted=True)
+        return TimingArc._format_condition({**inputs, **outputs})
+
+    @staticmethod
+    def _cond_str_with_outputs_no_internal(
+        inputs: Dict[str, str],
+        outputs: Dict[str, str],
+        cell: "Cell" | None,
+    ) -> str:
+        if not outputs:
+            return TimingArc._format_condition(inputs, presorted=True)
+        if cell is not None:
+            try:
+                internal_pins = cell.get_internal_pins()
+            except Exception:  # pragma: no cover - defensive guard
+                internal_pins = ()
+        else:
+            # Fallback heuristic for legacy-generated names when cell context
+            # is unavailable. This keeps behaviour stable in older tests.
+            internal_pins = [pin for pin in outputs if pin.endswith("_state")]
+        if internal_pins:
+            outputs = {
+                pin: value
+                for pin, value in outputs.items()
+                if pin not in internal_pins
+            }
+        return TimingArc._cond_str_with_outputs(inputs, outputs)
 
+    @staticmethod
+    def _format_condition(components: Dict[str, str], presorted: bool = False) -> str:
+        """Format ``{pin: value}`` as a sorted ``A*!B*C=x`` product term."""
         if not components:
             return ""
 
+        pins = list(components) if presorted else sorted(components)
+        if all(value in _BINARY_COND_VALUES for value in components.values()):
+            # Common case after normalization: only "0"/"1" literals
+            return "*".join([
+                pin if components[pin] == "1" else "!" + pin for pin in pins
+            ])
+
         terms: List[str] = []
-        for pin in sorted(components.keys()):
+        for pin in pins:
             value = components[pin]
             if value == "1":
                 terms.append(pin)
@@ -246,73 +426,75 @@ class TimingArc:
     def normalize_conditions(self, cell: "Cell" | None) -> None:
         """Normalize condition dictionaries and refresh the condition string."""
 
-        self._normalize_conditions(cell)
-        if cell is not None:
+        self._cached_key = None
+        if cell is None:
+            self._normalize_conditions(None)
+            self.reconstruct_condition()
+            return
+
+        # Partition once and format from the result, rather than letting
+        # condition_string() classify the pins a second time.
+        inputs, outputs = self._partition_conditions(cell)
+        self.condition_dict = inputs
+        self.output_condition_dict = outputs
+        if self.timing_type == 'leakage_power':
             # For leakage_power arcs, include output pins in condition string
-            # to distinguish different output states (e.g., Q=0 vs Q=1)
-            include_outputs = self.timing_type == 'leakage_power'
-            self.condition = self.condition_string(
-                cell=cell,
-                include_outputs=include_outputs,
-                include_internal=False  # Exclude internal state pins from condition
+            # to distinguish different output states (e.g., Q=0 vs Q=1), but
+            # exclude internal state pins
+            self.condition = self._cond_str_with_outputs_no_internal(
+                inputs, outputs, cell
             )
         else:
-            self.reconstruct_condition()
+            self.condition = self._cond_str_inputs_only(inputs)
 
     def _partition_conditions(
         self,
         cell: "Cell" | None,
     ) -> Tuple[Dict[str, str], Dict[str, str]]:
-        raw_conditions = getattr(self, "condition_dict", None)
-        condition_dict = dict(raw_conditions) if raw_conditions else {}
-
+        norm = self._normalize_condition_value
         # Merge pre-existing output conditions to the lookup table
         outputs: Dict[str, str] = {
-            pin: self._normalize_condition_value(value)
+            pin: norm(value)
             for pin, value in (self.output_condition_dict or {}).items()
         }
         inputs: Dict[str, str] = {}
 
+        condition_dict = self.condition_dict
         if not condition_dict:
             return inputs, outputs
 
-        output_pins: set[str] = set(outputs.keys())
+        output_pins: FrozenSet[str] = frozenset()
         if cell is not None:
             try:
-                output_pins.update(cell.get_output_pins())
                 # 内部状态引脚在仿真中不可直接驱动，按输出约束处理，避免被误判成输入条件
-                output_pins.update(cell.get_internal_pins())
+                output_pins = cell.get_output_and_internal_pin_set()
             except Exception:  # pragma: no cover - defensive
                 pass
-        else:
-            if (
-                self.pin
-                and self.pin != "-"
-                and self.pin_direction in {"output", "inout"}
-            ):
-                output_pins.add(self.pin)
-
+        elif (
+            self.pin
+            and self.pin != "-"
+            and self.pin_direction in _OUTPUT_LIKE_DIRECTIONS
+        ):
+            output_pins = frozenset((self.pin,))
+
+        # Bound lookups hoisted out of the per-pin loop
+        is_output = output_pins.__contains__
         for pin, value in condition_dict.items():
-            normalized = self._normalize_condition_value(value)
-            if pin in output_pins:
-                outputs[pin] = normalized
-            else:
-                inputs[pin] = normalized
+            target = outputs if pin in outputs or is_output(pin) else inputs
+            target[pin] = norm(value)
 
         return inputs, outputs
 
     @staticmethod
     def _normalize_condition_value(value: Any) -> str:
-        if isinstance(value, str):
-            if value in {"0", "1"}:
-                return value
-            if value.lower() in {"true", "high"}:
-                return "1"
-            if value.lower() in {"false", "low"}:
-                return "0"
-        if value in (1, True):
+        if type(value) is str:
+            hit = _COND_VALUE_MAP.get(value)
+            if hit is None:
+                hit = _COND_VALUE_MAP.get(value.lower())
+            return value if hit is None else hit
+        if value is True or value == 1:
             return "1"
-        if value in (0, False):
+        if value is False or value == 0:
             return "0"
         return str(value)
 
@@ -366,17 +548,16 @@ class TimingArc:
             self.mpw_values = None
             return
 
-        sanitized: List[float] = []
-        for raw in values:
-            try:
-                number = float(raw)
-            except (TypeError, ValueError) as exc:
-                raise ValidationError(f"MPW value '{raw}' is not numeric") from exc
-            if number < 0:
-                raise ValidationError("MPW values must be non-negative")
-            sanitized.append(number)
+        try:
+            arr = np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError) as exc:
+            raise ValidationError(f"MPW values {values!r} are not numeric") from exc
+        if arr.ndim != 1:
+            raise ValidationError("MPW values must be a one-dimensional sequence")
+        if np.isnan(arr).any() or (arr < 0).any():
+            raise ValidationError("MPW values must be non-negative and numeric")
 
-        self.mpw_values = sanitized
+        self.mpw_values = arr.tolist()
         self.is_simulated = True
         self._update_simulation_timestamp()
 
@@ -400,10 +581,57 @@ class TimingArc:
         self.is_simulated = True
         self._update_simulation_timestamp()
 
+    def set_all_values(
+        self,
+        *,
+        delay_values: Optional[List[List[float]]] = None,
+        transition_values: Optional[List[List[float]]] = None,
+        power_values: Optional[List[List[float]]] = None,
+        constraint_values: Optional[List[List[float]]] = None,
+        leakage_power: Optional[float] = None,
+        input_capacitance: Optional[float] = None,
+    ) -> None:
+        """批量设置仿真结果，只更新一次仿真时间戳
+
+        Args:
+            delay_values: 2D延迟值表
+            transition_values: 2D转换时间值表
+            power_values: 2D功耗值表
+            constraint_values: 2D约束值表
+            leakage_power: 泄漏功耗值
+            input_capacitance: 输入电容值
+
+        为 None 的参数保持原值不变。
+        """
+        if delay_values is not None:
+            self.delay_values = delay_values
+        if transition_values is not None:
+            self.transition_values = transition_values
+        if power_values is not None:
+            self.power_values = power_values
+        if constraint_values is not None:
+            self.constraint_values = constraint_values
+        if leakage_power is not None:
+            self.leakage_power = leakage_power
+        if input_capacitance is not None:
+            self.input_capacitance = input_capacitance
+        self.is_simulated = True
+        self._update_simulation_timestamp()
+
+    def ensure_simulation_metadata(self) -> Dict[str, Any]:
+        """返回仿真元数据字典，首次写入时才创建
+
+        Returns:
+            Dict: 可直接写入的 simulation_metadata
+        """
+        metadata = self.simulation_metadata
+        if metadata is None:
+            metadata = self.simulation_metadata = {}
+        return metadata
+
     def _update_simulation_timestamp(self) -> None:
         """更新仿真时间戳"""
-        import time
-        self.simulation_metadata['last_simulated'] = time.time()
+        self.ensure_simulation_metadata()['last_simulated'] = _wall_time()
 
     def has_simulation_results(self) -> bool:
         """检查是否有仿真结果
@@ -419,9 +647,84 @@ class TimingArc:
                 self.leakage_power is not None or
                 self.input_capacitance is not None)
 
-    def get_simulation_result_summary(self) -> Dict[str, Any]:
+    def values_array(self, kind: str, dtype: Any = np.float64) -> Optional[np.ndarray]:
+        """以 numpy 数组形式返回仿真结果表
+
+        结果表仍以嵌套 list 保存（导出与写回逻辑依赖 list 语义）；
+        批量数值分析可通过此方法取得连续内存的数组，必要时用
+        ``dtype=np.float32`` 减少内存占用。
+
+        Args:
+            kind: 'delay'、'transition'、'power'、'constraint' 或 'mpw'
+            dtype: 数组元素类型，默认 float64
+
+        Returns:
+            np.ndarray: 结果表数组；尚无结果时返回 None
+
+        Raises:
+            ValidationError: kind 不是已知的结果表
+        """
+        attr = _VALUE_TABLE_FIELDS.get(kind)
+        if attr is None:
+            raise ValidationError(
+                f"Unknown value table '{kind}'. "
+                f"Must be one of: {sorted(_VALUE_TABLE_FIELDS)}"
+            )
+        values = getattr(self, attr)
+        if values is None:
+            return None
+        return np.asarray(values, dtype=dtype)
+
+    @staticmethod
+    def bulk_table_stats(
+        arcs: Iterable["TimingArc"], kind: str = "delay"
+    ) -> Optional[Tuple[float, float]]:
+        """统计一组 TimingArc 某类结果表的最小/最大值
+
+        所有表展平后拼接为一个数组，由 numpy 一次完成归约，
+        适用于整库 QA/排序等批量扫描。
+
+        Args:
+            arcs: 待统计的 TimingArc
+            kind: 'delay'、'transition'、'power'、'constraint' 或 'mpw'
+
+        Returns:
+            Tuple[float, float]: (最小值, 最大值)；没有任何结果时返回 None
+
+        Raises:
+            ValidationError: kind 未知或某个结果表不是规则的数值表
+        """
+        attr = _VALUE_TABLE_FIELDS.get(kind)
+        if attr is None:
+            raise ValidationError(
+                f"Unknown value table '{kind}'. "
+                f"Must be one of: {sorted(_VALUE_TABLE_FIELDS)}"
+            )
+        chunks: List[np.ndarray] = []
+        for arc in arcs:
+            values = getattr(arc, attr)
+            if values is None or len(values) == 0:
+                continue
+            try:
+                chunks.append(np.asarray(values, dtype=np.float64).ravel())
+            except (TypeError, ValueError) as exc:
+                raise ValidationError(
+                    f"{kind} values of {arc} are not a regular numeric table"
+                ) from exc
+        if not chunks:
+            return None
+        flat = np.concatenate(chunks)
+        if flat.size == 0:
+            return None
+        return float(flat.min()), float(flat.max())
+
+    def get_simulation_result_summary(self, copy_metadata: bool = False) -> Dict[str, Any]:
         """获取仿真结果摘要
 
+        Args:
+            copy_metadata: 为 True 时 simulation_metadata_dict 为独立副本；
+                默认返回只读视图（MappingProxyType），会反映之后的修改
+
         Returns:
             Dict: 仿真结果摘要信息
         """
@@ -436,20 +739,24 @@ class TimingArc:
         }
 
         # 添加表格维度信息
-        if self.delay_values:
-            summary['delay_table_size'] = f"{len(self.delay_values)}x{len(self.delay_values[0]) if self.delay_values[0] else 0}"
-        if self.transition_values:
-            summary['transition_table_size'] = f"{len(self.transition_values)}x{len(self.transition_values[0]) if self.transition_values[0] else 0}"
-        if self.power_values:
-            summary['power_table_size'] = f"{len(self.power_values)}x{len(self.power_values[0]) if self.power_values[0] else 0}"
-        if self.constraint_values:
-            summary['constraint_table_size'] = f"{len(self.constraint_values)}x{len(self.constraint_values[0]) if self.constraint_values[0] else 0}"
-        if self.mpw_values:
+        for label, values in (
+            ('delay', self.delay_values),
+            ('transition', self.transition_values),
+            ('power', self.power_values),
+            ('constraint', self.constraint_values),
+        ):
+            shape = _table_shape(values)
+            if shape is not None:
+                summary[f'{label}_table_size'] = f"{shape[0]}x{shape[1]}"
+        if self.mpw_values is not None and len(self.mpw_values):
             summary['mpw_vector_length'] = len(self.mpw_values)
 
         # 添加仿真元数据
         if self.simulation_metadata:
-            summary['simulation_metadata_dict'] = self.simulation_metadata.copy()
+            summary['simulation_metadata_dict'] = (
+                dict(self.simulation_metadata) if copy_metadata
+                else MappingProxyType(self.simulation_metadata)
+            )
 
         return summary
 
@@ -475,8 +782,17 @@ class TimingArc:
         arc = cls(**kwargs)
         arc.normalize_conditions(cell)
 
-        from .timing_arc_validator import TimingArcValidator
-        TimingArcValidator.validate_with_cell(arc, cell)
+        validator = _get_validator_cls()
+        # The pin-existence/direction verdict depends only on these fields
+        # and the cell's pins, so it is cached on the cell (and dropped
+        # whenever its pins change). Field and condition checks still run
+        # for every arc.
+        integration_key = (arc.pin, arc.related_pin, arc.timing_type)
+        validated = cell._arc_validation_cache
+        if integration_key not in validated:
+            validator.validate_cell_integration(arc, cell)
+            validated.add(integration_key)
+        validator.validate_complete_arc(arc)
 
         return arc
     
@@ -501,18 +817,16 @@ class TimingArc:
             raise ValidationError("Table type cannot be empty")
         
         # Enum value validation
-        valid_timing_types = {e.value for e in TimingType}
-        if self.timing_type not in valid_timing_types:
+        if self.timing_type not in ALL_TIMING_TYPES:
             raise ValidationError(
                 f"Invalid timing type '{self.timing_type}'. "
-                f"Must be one of: {valid_timing_types}"
+                f"Must be one of: {sorted(ALL_TIMING_TYPES)}"
             )
         
-        valid_table_types = {e.value for e in TableType}
-        if self.table_type not in valid_table_types:
+        if self.table_type not in ALL_TABLE_TYPES:
             raise ValidationError(
                 f"Invalid table type '{self.table_type}'. "
-                f"Must be one of: {valid_table_types}"
+                f"Must be one of: {sorted(ALL_TABLE_TYPES)}"
             )
     
 
@@ -520,64 +834,52 @@ class TimingArc:
     @property
     def is_hidden_arc(self) -> bool:
         """Check if this is a hidden power arc."""
-        return self.timing_type == TimingType.HIDDEN.value
+        return bool(self._kind_flags & _KIND_HIDDEN)
     
     @property
     def is_constraint_arc(self) -> bool:
         """Check if this is a constraint arc."""
-        constraint_types = {
-            TimingType.SETUP_RISING.value,
-            TimingType.SETUP_FALLING.value,
-            TimingType.HOLD_RISING.value,
-            TimingType.HOLD_FALLING.value,
-            TimingType.RECOVERY_RISING.value,
-            TimingType.RECOVERY_FALLING.value,
-            TimingType.REMOVAL_RISING.value,
-            TimingType.REMOVAL_FALLING.value,
-            TimingType.MIN_PULSE_WIDTH.value
-        }
-        return self.timing_type in constraint_types
+        return bool(self._kind_flags & _KIND_CONSTRAINT)
     
     @property
     def is_delay_arc(self) -> bool:
         """Check if this is a delay arc."""
-        delay_types = {
-            TimingType.COMBINATIONAL.value,
-            TimingType.RISING_EDGE.value,
-            TimingType.FALLING_EDGE.value
-        }
-        return self.timing_type in delay_types
+        return bool(self._kind_flags & _KIND_DELAY)
     
     @property
     def is_power_arc(self) -> bool:
         """Check if this is a power arc."""
-        power_table_types = {
-            TableType.RISE_POWER.value,
-            TableType.FALL_POWER.value
-        }
-        return self.table_type in power_table_types
+        return bool(self._kind_flags & _KIND_POWER)
     
     @property
     def is_transition_arc(self) -> bool:
         """Check if this is a transition time arc."""
-        transition_table_types = {
-            TableType.RISE_TRANSITION.value,
-            TableType.FALL_TRANSITION.value
-        }
-        return self.table_type in transition_table_types
+        return bool(self._kind_flags & _KIND_TRANSITION)
     
     def get_arc_key(self) -> str:
         """
         Generate a unique key for this timing arc.
         
+        The key is computed once and memoized. Code that assigns ``pin``,
+        ``related_pin``, ``timing_type``, ``table_type`` or ``condition``
+        directly must call :meth:`invalidate_key` afterwards.
+
         Returns:
             String key that uniquely identifies this arc
         """
-        return (
-            f"{self.pin}:{self.related_pin}:"
-            f"{self.timing_type}:{self.table_type}:"
-            f"{self.condition}"
-        )
+        key = self._cached_key
+        if key is None:
+            key = self._cached_key = (
+                f"{self.pin}:{self.related_pin}:"
+                f"{self.timing_type}:{self.table_type}:"
+                f"{self.condition}"
+            )
+        return key
+
+    def invalidate_key(self) -> None:
+        """Refresh the memoized arc key and kind flags after a direct field assignment."""
+        self._cached_key = None
+        self._update_kind_flags()
 
     def __str__(self) -> str:
         """Concise string representation of timing arc (compatible with tests)."""
@@ -612,58 +914,55 @@ class TimingArc:
         Returns:
             Formatted multi-line string with all arc information
         """
-        lines = []
+        buf = io.StringIO()
+        w = buf.write
         
         # Header with arc identification
         header = f"┌─ TimingArc: {self.related_pin} → {self.pin} ─"
-        lines.append(header + "─" * (60 - len(header)))
+        w(header + "─" * (60 - len(header)) + "\n")
         
         # Basic arc information
-        lines.append(f"│ Type: {self.timing_type}")
-        lines.append(f"│ Table: {self.table_type}")
+        w(f"│ Type: {self.timing_type}\n│ Table: {self.table_type}\n")
         
         # Pin information
         if self.related_pin != "-":
-            lines.append(f"│ Related Pin: {self.related_pin} ({self.related_transition})")
-        lines.append(f"│ Output Pin: {self.pin} ({self.pin_transition})")
+            w(f"│ Related Pin: {self.related_pin} ({self.related_transition})\n")
+        w(f"│ Output Pin: {self.pin} ({self.pin_transition})\n")
         
         # Condition
         if self.condition:
-            lines.append(f"│ Condition: {self.condition}")
+            w(f"│ Condition: {self.condition}\n")
         
         # Simulation status
         status_icon = "✓" if self.is_simulated else "✗"
-        lines.append(f"│ Simulated: {status_icon} {self.is_simulated}")
+        w(f"│ Simulated: {status_icon} {self.is_simulated}\n")
         
         # Results summary
         if self.has_simulation_results():
-            lines.append("│ Results:")
-            if self.delay_values:
-                size = f"{len(self.delay_values)}×{len(self.delay_values[0])}"
-                lines.append(f"│   └─ Delay: {size} table")
-            if self.transition_values:
-                size = f"{len(self.transition_values)}×{len(self.transition_values[0])}"
-                lines.append(f"│   └─ Transition: {size} table")
-            if self.power_values:
-                size = f"{len(self.power_values)}×{len(self.power_values[0])}"
-                lines.append(f"│   └─ Power: {size} table")
-            if self.constraint_values:
-                size = f"{len(self.constraint_values)}×{len(self.constraint_values[0])}"
-                lines.append(f"│   └─ Constraint: {size} table")
+            w("│ Results:\n")
+            for label, values in (
+                ("Delay", self.delay_values),
+                ("Transition", self.transition_values),
+                ("Power", self.power_values),
+                ("Constraint", self.constraint_values),
+            ):
+                shape = _table_shape(values)
+                if shape is not None:
+                    w(f"│   └─ {label}: {shape[0]}×{shape[1]} table\n")
             if self.leakage_power is not None:
-                lines.append(f"│   └─ Leakage: {self.leakage_power:.2e} W")
+                w(f"│   └─ Leakage: {self.leakage_power:.2e} W\n")
             if self.input_capacitance is not None:
-                lines.append(f"│   └─ Input Cap: {self.input_capacitance:.2e} F")
+                w(f"│   └─ Input Cap: {self.input_capacitance:.2e} F\n")
         
         # Metadata
         if self.metadata:
-            lines.append("│ Metadata:")
+            w("│ Metadata:\n")
             for key, value in self.metadata.items():
-                lines.append(f"│   └─ {key}: {value}")
+                w(f"│   └─ {key}: {value}\n")
         
-        lines.append("└" + "─" * 59)
+        w(_DETAILS_FOOTER)
         
-        return "\n".join(lines)
+        return buf.getvalue()
     
     def print_compact(self) -> str:
         """
@@ -690,22 +989,7 @@ class TimingArc:
             trans = "__"
         
         # Type abbreviation
-        type_abbrev = {
-            "combinational": "COMB",
-            "rising_edge": "RISE",
-            "falling_edge": "FALL",
-            "setup_rising": "SETUP_R",
-            "setup_falling": "SETUP_F",
-            "hold_rising": "HOLD_R",
-            "hold_falling": "HOLD_F",
-            "recovery_rising": "RECOV_R",
-            "recovery_falling": "RECOV_F",
-            "removal_rising": "REMOV_R",
-            "removal_falling": "REMOV_F",
-            "min_pulse_width": "MPW",
-            "hidden": "HIDDEN",
-            "leakage_power": "LEAK"
-        }.get(self.timing_type, self.timing_type[:8].upper())
+        type_abbrev = _TYPE_ABBREV.get(self.timing_type) or self.timing_type[:8].upper()
         
         # Condition
         cond = f" ({self.condition})" if self.condition else ""
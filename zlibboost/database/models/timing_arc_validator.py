@@ -4,13 +4,81 @@ Timing Arc Validator - 统一的验证架构
 这个模块提供了基于最终状态的验证逻辑，避免重复验证和外部依赖。
 """
 
-from typing import Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, Iterable, Mapping, NamedTuple, Optional, Tuple
 from zlibboost.core.exceptions import ValidationError
 
+# timing_arc only imports this module lazily, so a top-level import is safe.
+from .timing_arc import (
+    ALL_PIN_DIRECTIONS,
+    ALL_TRANSITION_DIRECTIONS,
+    TableType,
+    TimingType,
+)
+
+
+_VALID_PIN_DIRECTIONS = ALL_PIN_DIRECTIONS
+_VALID_PIN_DIRECTIONS_WITH_DASH = ALL_PIN_DIRECTIONS | {'-'}
+_VALID_TRANSITIONS = ALL_TRANSITION_DIRECTIONS
+_VALID_TRANSITIONS_WITH_DASH = ALL_TRANSITION_DIRECTIONS | {'-'}
+_VALID_LOGIC_VALUES = frozenset({'0', '1'})
+# Shared read-only stand-in for arcs without static conditions
+_EMPTY_COND: Mapping[str, str] = MappingProxyType({})
+
+_DELAY_TIMING_TYPES = frozenset({
+    TimingType.COMBINATIONAL.value,
+    TimingType.RISING_EDGE.value,
+    TimingType.FALLING_EDGE.value,
+})
+_EDGE_TIMING_TYPES = frozenset({
+    TimingType.RISING_EDGE.value,
+    TimingType.FALLING_EDGE.value,
+})
+_SETUP_HOLD_TIMING_TYPES = frozenset({
+    TimingType.SETUP_RISING.value,
+    TimingType.SETUP_FALLING.value,
+    TimingType.HOLD_RISING.value,
+    TimingType.HOLD_FALLING.value,
+})
+_CONSTRAINT_TIMING_TYPES = _SETUP_HOLD_TIMING_TYPES | {
+    TimingType.RECOVERY_RISING.value,
+    TimingType.RECOVERY_FALLING.value,
+    TimingType.REMOVAL_RISING.value,
+    TimingType.REMOVAL_FALLING.value,
+}
+# Timing types whose related_pin must be an input (or inout) pin
+_RELATED_INPUT_TIMING_TYPES = (
+    _DELAY_TIMING_TYPES
+    | _CONSTRAINT_TIMING_TYPES
+    | {TimingType.MIN_PULSE_WIDTH.value}
+)
+# (pin role in messages, required clock transition) for edge/constraint arcs
+_CLOCKED_ARC_RULES: Dict[str, tuple] = {
+    TimingType.RISING_EDGE.value: ('output', 'rise'),
+    TimingType.FALLING_EDGE.value: ('output', 'fall'),
+    TimingType.SETUP_RISING.value: ('data', 'rise'),
+    TimingType.SETUP_FALLING.value: ('data', 'fall'),
+    TimingType.HOLD_RISING.value: ('data', 'rise'),
+    TimingType.HOLD_FALLING.value: ('data', 'fall'),
+    TimingType.RECOVERY_RISING.value: ('data', 'rise'),
+    TimingType.RECOVERY_FALLING.value: ('data', 'fall'),
+    TimingType.REMOVAL_RISING.value: ('data', 'rise'),
+    TimingType.REMOVAL_FALLING.value: ('data', 'fall'),
+}
+# Timing types that must not have a related_pin
+_NO_RELATED_PIN_TYPES = frozenset({
+    TimingType.HIDDEN.value,
+    TimingType.LEAKAGE_POWER.value,
+})
+
 
 class TimingArcValidator:
     """统一的时序弧验证器，基于最终状态进行验证。"""
     
+    # timing_type -> transition check, filled in after the class body
+    _TRANSITION_CHECKS: ClassVar[Dict[str, Callable[[str, str, str, Dict[str, str]], None]]] = {}
+    
     @classmethod
     def validate_semantics(cls, 
                           pin: str,
@@ -18,7 +86,7 @@ class TimingArcValidator:
                           related_pin: str, 
                           related_transition: Optional[str],
                           timing_type: str,
-                          condition_dict: Dict[str, str]) -> None:
+                          condition_dict: Mapping[str, str]) -> None:
         """
         验证时序弧的语义正确性。
         
@@ -36,124 +104,160 @@ class TimingArcValidator:
         Raises:
             ValidationError: 如果验证失败
         """
-        # 构建 transitions 字典
+        # 构建 transitions 字典（仅 rise/fall 的非占位引脚参与）
+        tp1 = pin if (pin != '-' and pin_transition in _VALID_TRANSITIONS) else None
+        tp2 = related_pin if (related_pin != '-' and related_transition in _VALID_TRANSITIONS) else None
         transitions = {}
-        if pin != '-' and pin_transition in ['rise', 'fall']:
-            transitions[pin] = pin_transition
-        if related_pin != '-' and related_transition in ['rise', 'fall']:
-            transitions[related_pin] = related_transition
-        
-        # 验证引脚不能同时有转换和静态条件
-        transition_pins = set(transitions.keys())
-        condition_pins = set(condition_dict.keys())
-        overlap = transition_pins & condition_pins
+        if tp1:
+            transitions[tp1] = pin_transition
+        if tp2:
+            transitions[tp2] = related_transition
+        
+        # 验证引脚不能同时有转换和静态条件（无重叠时不构建集合）
+        overlap = [p for p in (tp1, tp2) if p and p in condition_dict]
         if overlap:
             raise ValidationError(
-                f"Pins cannot have both transition and static condition: {overlap}"
+                f"Pins cannot have both transition and static condition: {set(overlap)}"
             )
         
-        # 验证静态条件值
-        cls._validate_condition_values(condition_dict)
+        # 验证静态条件值（多数弧没有静态条件，直接跳过）
+        if condition_dict:
+            cls._validate_condition_values(condition_dict)
         
         # 验证基于时序类型的转换要求
         cls._validate_timing_type_transitions(timing_type, pin, related_pin, transitions)
     
     @classmethod
-    def _validate_condition_values(cls, condition_dict: Dict[str, str]) -> None:
+    def _validate_condition_values(cls, condition_dict: Mapping[str, str]) -> None:
         """验证静态条件值的有效性。"""
-        valid_values = {'0', '1'}
+        # 一次子集判断覆盖常见的全部合法情形，只有失败时才逐项定位
+        if _VALID_LOGIC_VALUES.issuperset(condition_dict.values()):
+            return
         for pin_name, value in condition_dict.items():
-            if value not in valid_values:
+            if value not in _VALID_LOGIC_VALUES:
                 raise ValidationError(
                     f"Invalid logic value '{value}' for pin '{pin_name}'. "
-                    f"Must be one of: {valid_values}"
+                    f"Must be one of: {set(_VALID_LOGIC_VALUES)}"
                 )
     
     @classmethod
     def _validate_timing_type_transitions(cls, timing_type: str, pin: str, 
                                         related_pin: str, transitions: Dict[str, str]) -> None:
         """验证基于时序类型的转换要求。"""
-        
-        if timing_type == "combinational":
-            # 组合逻辑：输出引脚和输入引脚必须都有转换
-            if pin not in transitions:
-                raise ValidationError(f"Combinational arc: output pin '{pin}' must have transition")
-            if related_pin != '-' and related_pin not in transitions:
-                raise ValidationError(f"Combinational arc: input pin '{related_pin}' must have transition")
-            
-            # 只有这两个引脚应该有转换
-            expected_pins = {pin}
-            if related_pin != '-':
-                expected_pins.add(related_pin)
-            extra_transitions = set(transitions.keys()) - expected_pins
-            if extra_transitions:
-                raise ValidationError(f"Combinational arc: unexpected transitions on pins: {extra_transitions}")
-        
-        elif timing_type == "hidden":
-            # 隐藏弧：只有输入引脚有转换
-            if pin not in transitions:
-                raise ValidationError(f"Hidden arc: input pin '{pin}' must have transition")
-            if len(transitions) != 1:
-                raise ValidationError(f"Hidden arc: must have exactly 1 transition, found {len(transitions)}")
-        
-        elif timing_type in ["rising_edge", "falling_edge"]:
-            # 边沿触发：输出和时钟引脚都必须有转换
-            if pin not in transitions:
-                raise ValidationError(f"{timing_type} arc: output pin '{pin}' must have transition")
-            if related_pin != '-' and related_pin not in transitions:
-                raise ValidationError(f"{timing_type} arc: clock pin '{related_pin}' must have transition")
-            
-            # 验证时钟转换方向
-            if related_pin != '-' and related_pin in transitions:
-                expected_dir = 'rise' if timing_type == "rising_edge" else 'fall'
-                if transitions[related_pin] != expected_dir:
-                    raise ValidationError(
-                        f"{timing_type} arc: clock pin '{related_pin}' must have {expected_dir} transition"
-                    )
-        
-        elif timing_type in ["setup_rising", "setup_falling", "hold_rising", "hold_falling",
-                             "recovery_rising", "recovery_falling", "removal_rising", "removal_falling"]:
-            # 约束弧：数据和时钟引脚都必须有转换
-            if pin not in transitions:
-                raise ValidationError(f"{timing_type} arc: data pin '{pin}' must have transition")
-            if related_pin != '-' and related_pin not in transitions:
-                raise ValidationError(f"{timing_type} arc: clock pin '{related_pin}' must have transition")
-            
-            # 验证时钟转换方向
-            if related_pin != '-' and related_pin in transitions:
-                if timing_type.endswith("_rising"):
-                    expected_dir = 'rise'
-                elif timing_type.endswith("_falling"):
-                    expected_dir = 'fall'
-                else:
-                    expected_dir = None
-                
-                if expected_dir and transitions[related_pin] != expected_dir:
-                    raise ValidationError(
-                        f"{timing_type} arc: clock pin '{related_pin}' must have {expected_dir} transition"
-                    )
-        
-        elif timing_type == "min_pulse_width":
-            # 最小脉宽：只有时钟引脚有转换
-            if related_pin == '-':
-                raise ValidationError("Min pulse width arc must have related_pin (clock)")
+        check = cls._TRANSITION_CHECKS.get(timing_type)
+        if check is not None:
+            check(timing_type, pin, related_pin, transitions)
+    
+    @staticmethod
+    def _check_combinational_transitions(timing_type: str, pin: str,
+                                         related_pin: str, transitions: Dict[str, str]) -> None:
+        # 组合逻辑：输出引脚和输入引脚必须都有转换
+        if pin not in transitions:
+            raise ValidationError(f"Combinational arc: output pin '{pin}' must have transition")
+        if related_pin != '-' and related_pin not in transitions:
+            raise ValidationError(f"Combinational arc: input pin '{related_pin}' must have transition")
+        
+        # 只有这两个引脚应该有转换
+        expected_pins = {pin}
+        if related_pin != '-':
+            expected_pins.add(related_pin)
+        extra_transitions = set(transitions.keys()) - expected_pins
+        if extra_transitions:
+            raise ValidationError(f"Combinational arc: unexpected transitions on pins: {extra_transitions}")
+    
+    @staticmethod
+    def _check_hidden_transitions(timing_type: str, pin: str,
+                                  related_pin: str, transitions: Dict[str, str]) -> None:
+        # 隐藏弧：只有输入引脚有转换
+        if pin not in transitions:
+            raise ValidationError(f"Hidden arc: input pin '{pin}' must have transition")
+        if len(transitions) != 1:
+            raise ValidationError(f"Hidden arc: must have exactly 1 transition, found {len(transitions)}")
+    
+    @staticmethod
+    def _check_clocked_transitions(timing_type: str, pin: str,
+                                   related_pin: str, transitions: Dict[str, str]) -> None:
+        # 边沿触发 / 约束弧：pin 和时钟引脚都必须有转换，且时钟方向与类型一致
+        pin_role, expected_dir = _CLOCKED_ARC_RULES[timing_type]
+        if pin not in transitions:
+            raise ValidationError(f"{timing_type} arc: {pin_role} pin '{pin}' must have transition")
+        if related_pin != '-':
             if related_pin not in transitions:
-                raise ValidationError(f"Min pulse width arc: clock pin '{related_pin}' must have transition")
-            if len(transitions) != 1:
-                raise ValidationError(f"Min pulse width arc: must have exactly 1 transition, found {len(transitions)}")
-        
-        elif timing_type == "async":
-            # 异步弧：输出和控制引脚都必须有转换
-            if pin not in transitions:
-                raise ValidationError(f"Async arc: output pin '{pin}' must have transition")
-            if related_pin != '-' and related_pin not in transitions:
-                raise ValidationError(f"Async arc: control pin '{related_pin}' must have transition")
+                raise ValidationError(f"{timing_type} arc: clock pin '{related_pin}' must have transition")
+            if transitions[related_pin] != expected_dir:
+                raise ValidationError(
+                    f"{timing_type} arc: clock pin '{related_pin}' must have {expected_dir} transition"
+                )
+    
+    @staticmethod
+    def _check_min_pulse_width_transitions(timing_type: str, pin: str,
+                                           related_pin: str, transitions: Dict[str, str]) -> None:
+        # 最小脉宽：只有时钟引脚有转换
+        if related_pin == '-':
+            raise ValidationError("Min pulse width arc must have related_pin (clock)")
+        if related_pin not in transitions:
+            raise ValidationError(f"Min pulse width arc: clock pin '{related_pin}' must have transition")
+        if len(transitions) != 1:
+            raise ValidationError(f"Min pulse width arc: must have exactly 1 transition, found {len(transitions)}")
+    
+    @staticmethod
+    def _check_async_transitions(timing_type: str, pin: str,
+                                 related_pin: str, transitions: Dict[str, str]) -> None:
+        # 异步弧：输出和控制引脚都必须有转换
+        if pin not in transitions:
+            raise ValidationError(f"Async arc: output pin '{pin}' must have transition")
+        if related_pin != '-' and related_pin not in transitions:
+            raise ValidationError(f"Async arc: control pin '{related_pin}' must have transition")
     
     @classmethod
     def validate_with_cell(cls, arc, cell) -> None:
         """
         验证时序弧与单元的集成。
         
+        Args:
+            arc: TimingArc 对象
+            cell: Cell 对象
+            
+        Raises:
+            ValidationError: 如果验证失败
+        """
+        cls.validate_cell_integration(arc, cell)
+        
+        # 完整的业务逻辑验证
+        cls.validate_complete_arc(arc)
+    
+    @classmethod
+    def validate_arcs(cls, cell, arcs: Iterable[Any]) -> None:
+        """
+        批量验证同一单元的多条时序弧，等价于对每条弧调用 validate_with_cell。
+        
+        引脚存在性/方向检查只取决于 (pin, related_pin, timing_type)，
+        同一批次内每个组合只检查一次。
+        
+        Args:
+            cell: Cell 对象
+            arcs: 属于该单元的 TimingArc 对象
+            
+        Raises:
+            ValidationError: 遇到第一条验证失败的弧时
+        """
+        checked = set()
+        validate_integration = cls.validate_cell_integration
+        validate_complete = cls.validate_complete_arc
+        for arc in arcs:
+            key = (arc.pin, arc.related_pin, arc.timing_type)
+            if key not in checked:
+                validate_integration(arc, cell)
+                checked.add(key)
+            validate_complete(arc)
+    
+    @classmethod
+    def validate_cell_integration(cls, arc, cell) -> None:
+        """
+        验证时序弧引用的引脚在单元中存在且方向合理。
+        
+        结果只取决于 (pin, related_pin, timing_type) 与单元的引脚定义。
+        
         Args:
             arc: TimingArc 对象
             cell: Cell 对象
@@ -162,19 +266,16 @@ class TimingArcValidator:
             ValidationError: 如果验证失败
         """
         # 验证引脚存在性
-        all_pin_names = set(cell.pins.keys())
+        pins = cell.pins
         
-        if arc.pin not in all_pin_names and arc.pin != '-':
+        if arc.pin not in pins and arc.pin != '-':
             raise ValidationError(f"Pin '{arc.pin}' not found in cell '{cell.name}'")
         
-        if arc.related_pin != '-' and arc.related_pin not in all_pin_names:
+        if arc.related_pin != '-' and arc.related_pin not in pins:
             raise ValidationError(f"Related pin '{arc.related_pin}' not found in cell '{cell.name}'")
         
         # 验证引脚方向的业务逻辑合理性
         cls._validate_pin_directions(arc, cell)
-        
-        # 完整的业务逻辑验证
-        cls.validate_complete_arc(arc)
     
     @classmethod
     def validate_complete_arc(cls, arc) -> None:
@@ -188,7 +289,28 @@ class TimingArcValidator:
             
         Raises:
             ValidationError: 如果验证失败
+        
+        结构相同的弧（字段与条件完全一致）验证结论相同，结论按字段
+        元组缓存，重复出现的弧只需一次字典查找。
         """
+        conditions = arc.condition_dict
+        try:
+            error = _complete_arc_verdict(
+                arc.pin, arc.pin_direction, arc.pin_transition,
+                arc.related_pin, arc.related_transition,
+                arc.timing_type, arc.table_type,
+                frozenset(conditions.items()) if conditions else _NO_CONDITIONS,
+            )
+        except TypeError:
+            # Unhashable field or condition value: validate without the cache
+            cls._validate_complete_arc_uncached(arc)
+            return
+        if error is not None:
+            raise ValidationError(error)
+    
+    @classmethod
+    def _validate_complete_arc_uncached(cls, arc) -> None:
+        """validate_complete_arc 的实际检查逻辑。"""
         # 验证字段完整性
         cls._validate_arc_fields(arc)
         
@@ -199,7 +321,7 @@ class TimingArcValidator:
         cls.validate_semantics(
             arc.pin, arc.pin_transition,
             arc.related_pin, arc.related_transition,
-            arc.timing_type, arc.condition_dict or {}
+            arc.timing_type, arc.condition_dict or _EMPTY_COND
         )
     
     @classmethod
@@ -209,32 +331,30 @@ class TimingArcValidator:
         if not arc.pin_direction:
             raise ValidationError("Pin direction cannot be empty")
         
-        from .timing_arc import PinDirection, TransitionDirection, TableType
-        
-        valid_pin_directions = {e.value for e in PinDirection}
         # Allow '-' for leakage power arcs
-        if arc.table_type == TableType.LEAKAGE_POWER.value:
-            valid_pin_directions.add('-')
+        is_leakage = arc.table_type == TableType.LEAKAGE_POWER.value
+        valid_pin_directions = (
+            _VALID_PIN_DIRECTIONS_WITH_DASH if is_leakage else _VALID_PIN_DIRECTIONS
+        )
         
         if arc.pin_direction not in valid_pin_directions:
             raise ValidationError(
                 f"Invalid pin direction '{arc.pin_direction}'. "
-                f"Must be one of: {valid_pin_directions}"
+                f"Must be one of: {set(valid_pin_directions)}"
             )
         
         # 验证 pin_transition
         if not arc.pin_transition:
             raise ValidationError("Output transition cannot be empty")
         
-        valid_transitions = {e.value for e in TransitionDirection}
-        # Allow '-' for leakage power arcs
-        if arc.table_type == TableType.LEAKAGE_POWER.value:
-            valid_transitions.add('-')
+        valid_transitions = (
+            _VALID_TRANSITIONS_WITH_DASH if is_leakage else _VALID_TRANSITIONS
+        )
         
         if arc.pin_transition not in valid_transitions:
             raise ValidationError(
                 f"Invalid output transition '{arc.pin_transition}'. "
-                f"Must be one of: {valid_transitions}"
+                f"Must be one of: {set(valid_transitions)}"
             )
         
         # 验证 related_pin 和 related_transition
@@ -248,21 +368,13 @@ class TimingArcValidator:
             if arc.related_transition != '-':  # Allow '-' for hidden arcs
                 raise ValidationError(
                     f"Invalid related transition '{arc.related_transition}'. "
-                    f"Must be one of: {valid_transitions} or '-'"
+                    f"Must be one of: {set(valid_transitions)} or '-'"
                 )
     
     @classmethod
     def _validate_timing_type_consistency(cls, arc) -> None:
         """验证 timing_type 和 related_pin 的一致性。"""
-        from .timing_arc import TimingType
-        
-        # Timing types that should NOT have related_pin
-        no_related_pin_types = {
-            TimingType.HIDDEN.value,
-            TimingType.LEAKAGE_POWER.value
-        }
-        
-        if arc.timing_type in no_related_pin_types:
+        if arc.timing_type in _NO_RELATED_PIN_TYPES:
             if arc.related_pin != '-':
                 raise ValidationError(f"{arc.timing_type} arc should not have related_pin (use '-')")
         else:
@@ -281,63 +393,122 @@ class TimingArcValidator:
         Raises:
             ValidationError: 如果引脚方向不合理
         """
-        from .timing_arc import TimingType
+        role = _ARC_ROLE.get(arc.timing_type)
+        if role is None:
+            # 隐藏弧、泄漏功耗弧等没有常规方向要求
+            return
+        pin_rule, related_dirs, pin_checked_first = role
         
         # 获取引脚信息
-        pin_info = cell.pins.get(arc.pin) if arc.pin != '-' else None
-        related_pin_info = cell.pins.get(arc.related_pin) if arc.related_pin != '-' else None
-        
-        # 特殊情况：隐藏弧和泄漏功耗弧
-        if arc.timing_type in [TimingType.HIDDEN.value, TimingType.LEAKAGE_POWER.value]:
-            return  # 这些弧有特殊的引脚要求，不应用常规方向验证
-        
-        # 验证输出引脚方向
-        if pin_info and arc.timing_type in [
-            TimingType.COMBINATIONAL.value, 
-            TimingType.RISING_EDGE.value, 
-            TimingType.FALLING_EDGE.value
-        ]:
-            # 延迟弧：pin应该是输出引脚
-            if pin_info.direction not in ['output', 'inout']:
-                raise ValidationError(
-                    f"Delay arc pin '{arc.pin}' should be output pin, "
+        pins = cell.pins
+        pin_info = pins.get(arc.pin) if arc.pin != '-' else None
+        related_pin_info = pins.get(arc.related_pin) if arc.related_pin != '-' else None
+        
+        # 延迟弧的 pin 应为输出引脚；约束弧的 pin 应为输入（数据）引脚
+        pin_error = None
+        if pin_rule is not None and pin_info:
+            expected_dirs, label, expected_kind = pin_rule
+            if pin_info.direction not in expected_dirs:
+                pin_error = (
+                    f"{label} '{arc.pin}' should be {expected_kind} pin, "
                     f"but found '{pin_info.direction}' pin"
                 )
+        if pin_error and pin_checked_first:
+            raise ValidationError(pin_error)
         
-        # 验证related_pin方向
-        if related_pin_info:
-            # 大多数情况下，related_pin应该是输入引脚
-            if arc.timing_type in [
-                TimingType.COMBINATIONAL.value,
-                TimingType.RISING_EDGE.value,
-                TimingType.FALLING_EDGE.value,
-                TimingType.SETUP_RISING.value,
-                TimingType.SETUP_FALLING.value,
-                TimingType.HOLD_RISING.value,
-                TimingType.HOLD_FALLING.value,
-                TimingType.RECOVERY_RISING.value,
-                TimingType.RECOVERY_FALLING.value,
-                TimingType.REMOVAL_RISING.value,
-                TimingType.REMOVAL_FALLING.value,
-                TimingType.MIN_PULSE_WIDTH.value
-            ]:
-                # related_pin应该是输入引脚或双向引脚
-                if related_pin_info.direction not in ['input', 'inout']:
-                    raise ValidationError(
-                        f"Timing arc related_pin '{arc.related_pin}' should be input pin, "
-                        f"but found '{related_pin_info.direction}' pin"
-                    )
-        
-        # 约束弧的特殊验证：pin应该是数据引脚，related_pin应该是时钟引脚
-        if arc.timing_type in [
-            TimingType.SETUP_RISING.value,
-            TimingType.SETUP_FALLING.value,
-            TimingType.HOLD_RISING.value,
-            TimingType.HOLD_FALLING.value
-        ]:
-            # pin应该是输入引脚（数据引脚）
-            if pin_info and pin_info.direction not in ['input', 'inout']:
+        # 大多数情况下，related_pin 应该是输入引脚或双向引脚
+        if related_dirs is not None and related_pin_info:
+            if related_pin_info.direction not in related_dirs:
                 raise ValidationError(
-                    f"Constraint arc data pin '{arc.pin}' should be input pin, "
-                    f"but found '{pin_info.direction}' pin"
-                )
\ No newline at end of file
+                    f"Timing arc related_pin '{arc.related_pin}' should be input pin, "
+                    f"but found '{related_pin_info.direction}' pin"
+                )
+        
+        if pin_error:
+            raise ValidationError(pin_error)
+
+TimingArcValidator._TRANSITION_CHECKS = {
+    TimingType.COMBINATIONAL.value: TimingArcValidator._check_combinational_transitions,
+    TimingType.HIDDEN.value: TimingArcValidator._check_hidden_transitions,
+    TimingType.MIN_PULSE_WIDTH.value: TimingArcValidator._check_min_pulse_width_transitions,
+    TimingType.ASYNC.value: TimingArcValidator._check_async_transitions,
+    **dict.fromkeys(_CLOCKED_ARC_RULES, TimingArcValidator._check_clocked_transitions),
+}
+
+
+_OUTPUT_PIN_DIRECTIONS = frozenset(('output', 'inout'))
+_INPUT_PIN_DIRECTIONS = frozenset(('input', 'inout'))
+
+
+def _arc_role(timing_type: str) -> Optional[tuple]:
+    """Direction rules _validate_pin_directions applies to one timing type.
+
+    Returns (pin_rule, related_dirs, pin_checked_first), where pin_rule is
+    (expected directions, message label, expected kind) or None, or None
+    when the timing type has no direction requirements.
+    """
+    if timing_type in _NO_RELATED_PIN_TYPES:
+        return None
+    if timing_type in _DELAY_TIMING_TYPES:
+        pin_rule = (_OUTPUT_PIN_DIRECTIONS, 'Delay arc pin', 'output')
+    elif timing_type in _SETUP_HOLD_TIMING_TYPES:
+        pin_rule = (_INPUT_PIN_DIRECTIONS, 'Constraint arc data pin', 'input')
+    else:
+        pin_rule = None
+    related_dirs = (
+        _INPUT_PIN_DIRECTIONS if timing_type in _RELATED_INPUT_TIMING_TYPES else None
+    )
+    if pin_rule is None and related_dirs is None:
+        return None
+    # 延迟弧先检查 pin，约束弧的数据 pin 在 related_pin 之后检查
+    return pin_rule, related_dirs, timing_type in _DELAY_TIMING_TYPES
+
+
+# timing_type -> pin / related_pin direction rules, resolved once
+_ARC_ROLE: Dict[str, tuple] = {
+    timing_type: role
+    for timing_type in (t.value for t in TimingType)
+    if (role := _arc_role(timing_type)) is not None
+}
+
+
+class _ArcFields(NamedTuple):
+    """Stand-in exposing the TimingArc attributes validate_complete_arc reads."""
+    pin: str
+    pin_direction: str
+    pin_transition: str
+    related_pin: str
+    related_transition: str
+    timing_type: str
+    table_type: str
+    condition_dict: Mapping[str, Any]
+
+
+_NO_CONDITIONS: FrozenSet[Tuple[str, Any]] = frozenset()
+
+
+@lru_cache(maxsize=65536)
+def _complete_arc_verdict(
+    pin: str,
+    pin_direction: str,
+    pin_transition: str,
+    related_pin: str,
+    related_transition: str,
+    timing_type: str,
+    table_type: str,
+    conditions: FrozenSet[Tuple[str, Any]],
+) -> Optional[str]:
+    """Return None if the fields validate, else the ValidationError message.
+
+    Returning the message rather than raising keeps failures cacheable
+    without holding on to exception/traceback objects.
+    """
+    fields = _ArcFields(
+        pin, pin_direction, pin_transition, related_pin, related_transition,
+        timing_type, table_type, dict(conditions) if conditions else _EMPTY_COND,
+    )
+    try:
+        TimingArcValidator._validate_complete_arc_uncached(fields)
+    except ValidationError as exc:
+        return str(exc)
+    return None
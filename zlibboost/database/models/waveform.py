@@ -5,14 +5,17 @@ This module defines the Waveform class for managing driver waveforms
 used in timing characterization simulations.
 """
 
-from typing import List, Dict, Any, Optional, Union
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 import numpy as np
 
 from zlibboost.core.exceptions import ValidationError
+from .template import _reciprocal_widths
 
 
-@dataclass
+@dataclass(slots=True)
 class Waveform:
     """
     Represents a driver waveform with timing and amplitude information.
@@ -25,8 +28,13 @@ class Waveform:
         waveform_type: Type of waveform ('delay', 'constraint')
         index_1: First dimension index values (input transition time)
         index_2: Second dimension index values (output load capacitance)
-        values: 2D array of waveform values
+        values: 2D array of waveform values, stored as contiguous float64
         metadata: Additional waveform metadata
+    
+    index_1/index_2 keep the sequences they were given; float64 copies and
+    the lookup caches derived from them are built once at construction.
+    Code that modifies or reassigns index_1, index_2 or values afterwards
+    must call _recanonicalize().
     """
     name: str
     waveform_type: str
@@ -34,11 +42,34 @@ class Waveform:
     index_2: List[float]
     values: np.ndarray
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Contiguous float64 copies of the index grids for the vectorized path
+    _index_1_np: np.ndarray = field(init=False, repr=False, compare=False)
+    _index_2_np: np.ndarray = field(init=False, repr=False, compare=False)
+    # Python-float copies of the index grids for the scalar interpolation path
+    _index_1_seq: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _index_2_seq: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    # Reciprocal interval widths, so interpolation weights need no division
+    _inv_dx_1: np.ndarray = field(init=False, repr=False, compare=False)
+    _inv_dx_2: np.ndarray = field(init=False, repr=False, compare=False)
+    _inv_dx_1_seq: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _inv_dx_2_seq: Tuple[float, ...] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate waveform data after initialization."""
         self._validate()
     
+    def _recanonicalize(self) -> None:
+        """
+        Re-validate after index_1/index_2/values were mutated or reassigned.
+        
+        Converts the arrays back to contiguous float64 and rebuilds the
+        lookup caches, which would otherwise describe the old grid.
+        
+        Raises:
+            ValidationError: If the modified waveform data is invalid
+        """
+        self._validate()
+    
     def _validate(self) -> None:
         """
         Validate waveform data for consistency and correctness.
@@ -59,55 +90,61 @@ class Waveform:
                 f"Must be one of: {valid_types}"
             )
         
-        if not self.index_1:
+        # Keep contiguous float64 copies of the indices so lookups reuse them
+        try:
+            index_1_array = np.ascontiguousarray(self.index_1, dtype=np.float64)
+            index_2_array = np.ascontiguousarray(self.index_2, dtype=np.float64)
+        except (ValueError, TypeError) as e:
+            raise ValidationError(f"Index values must be numeric: {e}")
+        
+        if index_1_array.size == 0:
             raise ValidationError("index_1 cannot be empty")
         
-        if not self.index_2:
+        if index_2_array.size == 0:
             raise ValidationError("index_2 cannot be empty")
         
-        # Validate index values are numeric and sorted
-        try:
-            index_1_array = np.array(self.index_1, dtype=float)
-            index_2_array = np.array(self.index_2, dtype=float)
-        except (ValueError, TypeError) as e:
-            raise ValidationError(f"Index values must be numeric: {e}")
+        self._index_1_np = index_1_array
+        self._index_2_np = index_2_array
+        self._index_1_seq = tuple(index_1_array.tolist())
+        self._index_2_seq = tuple(index_2_array.tolist())
+        self._inv_dx_1 = _reciprocal_widths(index_1_array)
+        self._inv_dx_2 = _reciprocal_widths(index_2_array)
+        self._inv_dx_1_seq = tuple(self._inv_dx_1.tolist())
+        self._inv_dx_2_seq = tuple(self._inv_dx_2.tolist())
         
-        if not np.all(index_1_array[:-1] <= index_1_array[1:]):
+        # ``>= 0`` (rather than ``min() < 0``) so that NaN steps are rejected too
+        if not (np.diff(index_1_array) >= 0).all():
             raise ValidationError("index_1 values must be in non-decreasing order")
         
-        if not np.all(index_2_array[:-1] <= index_2_array[1:]):
+        if not (np.diff(index_2_array) >= 0).all():
             raise ValidationError("index_2 values must be in non-decreasing order")
         
-        # Validate values array
-        if not isinstance(self.values, np.ndarray):
-            try:
-                self.values = np.array(self.values, dtype=float)
-            except (ValueError, TypeError) as e:
-                raise ValidationError(f"Waveform values must be numeric: {e}")
+        # Validate values array (single contiguous float64 conversion)
+        try:
+            self.values = np.ascontiguousarray(self.values, dtype=np.float64)
+        except (ValueError, TypeError) as e:
+            raise ValidationError(f"Waveform values must be numeric: {e}")
         
-        expected_shape = (len(self.index_1), len(self.index_2))
+        expected_shape = (index_1_array.size, index_2_array.size)
         if self.values.shape != expected_shape:
             raise ValidationError(
                 f"Waveform values shape {self.values.shape} does not match "
                 f"expected shape {expected_shape}"
             )
         
-        # Check for invalid values (NaN, inf)
-        if np.any(np.isnan(self.values)):
-            raise ValidationError("Waveform values cannot contain NaN")
-        
-        if np.any(np.isinf(self.values)):
-            raise ValidationError("Waveform values cannot contain infinity")
+        # Check for invalid values (NaN, inf) in one pass
+        if not np.isfinite(self.values).all():
+            raise ValidationError("Waveform values must be finite")
     
     @property
     def dimensions(self) -> tuple[int, int]:
         """Get waveform dimensions as (rows, columns)."""
-        return len(self.index_1), len(self.index_2)
+        return self._index_1_np.size, self._index_2_np.size
     
     @property
     def is_square(self) -> bool:
         """Check if waveform has square dimensions."""
-        return len(self.index_1) == len(self.index_2)
+        return self._index_1_np.size == self._index_2_np.size
     
     @property
     def value_range(self) -> tuple[float, float]:
@@ -128,13 +165,15 @@ class Waveform:
         Raises:
             IndexError: If indices are out of bounds
         """
-        try:
-            return float(self.values[index_1_idx, index_2_idx])
-        except IndexError as e:
-            raise IndexError(
-                f"Index ({index_1_idx}, {index_2_idx}) is out of bounds "
-                f"for waveform with shape {self.values.shape}"
-            ) from e
+        values = self.values
+        rows, cols = values.shape
+        # Negative indices count from the end, as with direct array indexing
+        if -rows <= index_1_idx < rows and -cols <= index_2_idx < cols:
+            return values.item(index_1_idx, index_2_idx)
+        raise IndexError(
+            f"Index ({index_1_idx}, {index_2_idx}) is out of bounds "
+            f"for waveform with shape {values.shape}"
+        )
     
     def interpolate_value(self, index_1_val: float, index_2_val: float) -> float:
         """
@@ -151,14 +190,19 @@ class Waveform:
             ValueError: If values are out of range
         """
         # Find interpolation indices for both dimensions
-        i1_lower, i1_upper, w1 = self._interpolate_indices(index_1_val, self.index_1)
-        i2_lower, i2_upper, w2 = self._interpolate_indices(index_2_val, self.index_2)
+        i1_lower, i1_upper, w1 = self._interpolate_indices(
+            index_1_val, self._index_1_seq, self._inv_dx_1_seq
+        )
+        i2_lower, i2_upper, w2 = self._interpolate_indices(
+            index_2_val, self._index_2_seq, self._inv_dx_2_seq
+        )
         
-        # Bilinear interpolation
-        v00 = self.values[i1_lower, i2_lower]
-        v01 = self.values[i1_lower, i2_upper]
-        v10 = self.values[i1_upper, i2_lower]
-        v11 = self.values[i1_upper, i2_upper]
+        # Bilinear interpolation (item() yields Python floats, no NumPy scalar boxing)
+        item = self.values.item
+        v00 = item(i1_lower, i2_lower)
+        v01 = item(i1_lower, i2_upper)
+        v10 = item(i1_upper, i2_lower)
+        v11 = item(i1_upper, i2_upper)
         
         # Interpolate along index_2 first
         v0 = v00 * (1 - w2) + v01 * w2
@@ -169,50 +213,124 @@ class Waveform:
         
         return float(result)
     
-    def _interpolate_indices(self, value: float, indices: List[float]) -> tuple[int, int, float]:
+    def interpolate_values(self, index_1_vals, index_2_vals) -> np.ndarray:
+        """
+        Bilinearly interpolate waveform values for arrays of index values.
+        
+        Vectorized counterpart of interpolate_value(); inputs are broadcast
+        against each other and every point is evaluated in one NumPy pass.
+        
+        Args:
+            index_1_vals: Values for first dimension (scalar or array-like)
+            index_2_vals: Values for second dimension (scalar or array-like)
+            
+        Returns:
+            Array of interpolated values with the broadcast input shape
+            
+        Raises:
+            ValueError: If any value is out of range
+        """
+        x1, x2 = np.broadcast_arrays(
+            np.asarray(index_1_vals, dtype=np.float64),
+            np.asarray(index_2_vals, dtype=np.float64),
+        )
+        i1_lower, i1_upper, w1 = self._interpolate_indices_batch(x1, self._index_1_np, self._inv_dx_1)
+        i2_lower, i2_upper, w2 = self._interpolate_indices_batch(x2, self._index_2_np, self._inv_dx_2)
+        
+        values = self.values
+        v0 = values[i1_lower, i2_lower] * (1 - w2) + values[i1_lower, i2_upper] * w2
+        v1 = values[i1_upper, i2_lower] * (1 - w2) + values[i1_upper, i2_upper] * w2
+        return v0 * (1 - w1) + v1 * w1
+    
+    @staticmethod
+    def _interpolate_indices_batch(
+        values: np.ndarray, indices: np.ndarray, inv_dx: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized form of _interpolate_indices for an array of values.
+        
+        Args:
+            values: Values to interpolate
+            indices: Stored index array
+            inv_dx: Reciprocal interval widths of indices
+            
+        Returns:
+            Tuple of (lower_indices, upper_indices, weights) arrays
+        """
+        lo = indices[0]
+        hi = indices[-1]
+        out_of_range = ~((values >= lo) & (values <= hi))
+        if out_of_range.any():
+            value = values[out_of_range][0]
+            raise ValueError(f"Value {value} is out of range [{lo}, {hi}]")
+        
+        last = indices.size - 1
+        upper_idx = np.searchsorted(indices, values, side='right')
+        lower_idx = np.clip(upper_idx - 1, 0, last)
+        upper_idx = np.minimum(upper_idx, last)
+        
+        # At the last point inv_dx is 0.0, so no special case is needed
+        weight = (values - indices[lower_idx]) * inv_dx[lower_idx]
+        return lower_idx, upper_idx, weight
+    
+    def _interpolate_indices(
+        self, value: float, indices: Tuple[float, ...], inv_dx: Tuple[float, ...]
+    ) -> tuple[int, int, float]:
         """
         Find interpolation indices and weight for a given value.
         
         Args:
             value: Value to interpolate
-            indices: List of index values
+            indices: Index values as a tuple of Python floats
+            inv_dx: Reciprocal interval widths of indices
             
         Returns:
             Tuple of (lower_index, upper_index, weight)
         """
-        indices_array = np.array(indices)
-        
-        # Check bounds
-        if value < indices_array[0] or value > indices_array[-1]:
-            raise ValueError(
-                f"Value {value} is out of range [{indices_array[0]}, {indices_array[-1]}]"
-            )
+        # Check bounds (single bracket test; also rejects NaN)
+        lo = indices[0]
+        hi = indices[-1]
+        if not lo <= value <= hi:
+            raise ValueError(f"Value {value} is out of range [{lo}, {hi}]")
         
         # Find interpolation indices
-        upper_idx = np.searchsorted(indices_array, value, side='right')
+        upper_idx = bisect_right(indices, value)
         
         if upper_idx == 0:
             return 0, 0, 0.0
-        elif upper_idx == len(indices_array):
-            return len(indices_array) - 1, len(indices_array) - 1, 0.0
+        elif upper_idx == len(indices):
+            return len(indices) - 1, len(indices) - 1, 0.0
         else:
             lower_idx = upper_idx - 1
-            lower_val = indices_array[lower_idx]
-            upper_val = indices_array[upper_idx]
-            weight = (value - lower_val) / (upper_val - lower_val)
+            weight = (value - indices[lower_idx]) * inv_dx[lower_idx]
             return lower_idx, upper_idx, weight
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert waveform to dictionary representation."""
+    def to_dict(self, *, copy: bool = True) -> Dict[str, Any]:
+        """
+        Convert waveform to dictionary representation.
+        
+        Args:
+            copy: If True (default), values is a nested list and metadata a
+                copy. If False, values is a read-only view of the waveform's
+                array and metadata a read-only MappingProxyType, so callers
+                that only serialize the result skip the deep conversion.
+        """
+        if copy:
+            values = self.values.tolist()
+            metadata = self.metadata.copy()
+        else:
+            values = self.values.view()
+            values.flags.writeable = False
+            metadata = MappingProxyType(self.metadata)
         return {
             'name': self.name,
             'type': self.waveform_type,
-            'index_1': self.index_1.copy(),
-            'index_2': self.index_2.copy(),
-            'values': self.values.tolist(),
+            'index_1': self._index_1_np.tolist(),
+            'index_2': self._index_2_np.tolist(),
+            'values': values,
             'dimensions': self.dimensions,
             'value_range': self.value_range,
-            'metadata': self.metadata.copy()
+            'metadata': metadata
         }
     
     @classmethod
@@ -240,7 +358,7 @@ class Waveform:
             index_1=list(data['index_1']),
             index_2=list(data['index_2']),
             values=np.array(data['values']),
-            metadata=data.get('metadata', {})
+            metadata=dict(data.get('metadata', {}))
         )
     
     def __str__(self) -> str:
@@ -254,6 +372,6 @@ class Waveform:
         """Detailed string representation of waveform."""
         return (
             f"Waveform(name='{self.name}', waveform_type='{self.waveform_type}', "
-            f"index_1={self.index_1}, index_2={self.index_2}, "
+            f"index_1={self._index_1_np.tolist()}, index_2={self._index_2_np.tolist()}, "
             f"values_shape={self.values.shape}, metadata={self.metadata})"
         )
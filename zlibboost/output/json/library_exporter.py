@@ -13,19 +13,29 @@ from __future__ import annotations
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, TextIO, Tuple
 import copy
 import json
 import logging
 import math
 import re
 
+import numpy as np
+
 from zlibboost.database.library_db import CellLibraryDB
 from zlibboost.database.models.cell import Cell, PinInfo, PinCategory
 from zlibboost.database.models.timing_arc import TableType, TimingType
 
 logger = logging.getLogger(__name__)
 
+# Enum values compared for every arc in CellSerializer._populate_arc_data
+_MIN_PULSE_WIDTH_TYPE = TimingType.MIN_PULSE_WIDTH.value
+_ASYNC_TYPE = TimingType.ASYNC.value
+_RISE_POWER_TABLE = TableType.RISE_POWER.value
+_LEAKAGE_POWER_TABLE = TableType.LEAKAGE_POWER.value
+_POWER_TABLES = frozenset({TableType.RISE_POWER.value, TableType.FALL_POWER.value})
+_CONSTRAINT_TABLES = (TableType.RISE_CONSTRAINT.value, TableType.FALL_CONSTRAINT.value)
+
 
 @dataclass
 class ExporterConfig:
@@ -41,6 +51,152 @@ class ExporterConfig:
     indent: int = 4
 
 
+# str.translate table deleting the whitespace compress_lists strips
+_LIST_WHITESPACE = str.maketrans("", "", " \n")
+
+
+# Below this many vectors the per-value loops beat NumPy's conversion overhead
+_NUMPY_MERGE_MIN_VECTORS = 8
+
+
+# Tables smaller than this are sanitized faster by the per-value loop
+_NUMPY_SANITIZE_MIN_VALUES = 64
+
+
+def _as_regular_float_array(values: List[Any], ndim: int) -> Optional[np.ndarray]:
+    """
+    Convert a flat list or list of row lists into a float64 array of `ndim`.
+
+    Returns None for small, ragged, nested or non-numeric tables, and for
+    matrices with rows that are not lists; these keep the per-value path.
+    """
+    if ndim == 2:
+        if len(values) * len(values[0]) < _NUMPY_SANITIZE_MIN_VALUES:
+            return None
+        if not all(isinstance(row, list) for row in values):
+            return None
+    elif len(values) < _NUMPY_SANITIZE_MIN_VALUES:
+        return None
+    try:
+        array = np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    return array if array.ndim == ndim else None
+
+
+def _stack_vectors(vectors: List[List[float]]) -> Optional[np.ndarray]:
+    """
+    Stack equal-length numeric vectors into one 2-D float64 array.
+
+    Returns None for short inputs, ragged or nested vectors and entries that
+    do not convert to float; callers then fall back to their per-value loop.
+    None entries become NaN, which callers treat like skipped values.
+    """
+    if len(vectors) < _NUMPY_MERGE_MIN_VECTORS:
+        return None
+    try:
+        stacked = np.array(vectors, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    if stacked.ndim != 2:
+        return None
+    return stacked
+
+
+def _is_empty_json_value(value: Any) -> bool:
+    """Return True for the placeholders JsonCleaner drops (None, {}, [], "")."""
+    return value is None or (isinstance(value, (dict, list, str)) and not value)
+
+
+def _count_finite_values(matrix: Any) -> int:
+    """
+    Count the finite numeric entries of a row-major table.
+
+    Rows that are not lists and entries that do not convert to float are
+    ignored. Regular tables are counted with one NumPy conversion; ragged
+    or non-numeric tables fall back to a per-value scan.
+    """
+    if matrix and all(isinstance(row, list) for row in matrix):
+        try:
+            array = np.asarray(matrix, dtype=np.float64)
+        except (TypeError, ValueError):
+            pass
+        else:
+            if array.ndim == 2:
+                return int(np.count_nonzero(np.isfinite(array)))
+
+    finite_count = 0
+    for row in matrix:
+        if not isinstance(row, list):
+            continue
+        for value in row:
+            # Tables normally hold plain floats: range-check them directly
+            # (false for NaN and +/-inf) and only convert other types.
+            if type(value) is float:
+                if -math.inf < value < math.inf:
+                    finite_count += 1
+                continue
+            if isinstance(value, (int, float)):
+                numeric = value
+            else:
+                try:
+                    numeric = float(value)
+                except (TypeError, ValueError):
+                    continue
+            if math.isfinite(numeric):
+                finite_count += 1
+    return finite_count
+
+
+@dataclass(frozen=True, slots=True)
+class _PinSets:
+    """
+    Pin-category lookups for one cell, gathered once per serialized cell.
+
+    Categories whose first pin is used keep the cell's pin order (tuples);
+    the ones only used for membership tests are frozensets, and the
+    async/sync clear and preset intersections are precomputed.
+    """
+
+    clock: Tuple[str, ...]
+    clock_negative: Tuple[str, ...]
+    data: Tuple[str, ...]
+    enable: Tuple[str, ...]
+    scan_enable: Tuple[str, ...]
+    scan_in: Tuple[str, ...]
+    async_: FrozenSet[str]
+    sync: FrozenSet[str]
+    reset: FrozenSet[str]
+    set_: FrozenSet[str]
+    clear: FrozenSet[str]
+    preset: FrozenSet[str]
+    clear_sync: FrozenSet[str]
+    preset_sync: FrozenSet[str]
+
+    @classmethod
+    def from_cell(cls, cell: Cell) -> "_PinSets":
+        async_pins = frozenset(cell.get_async_pins())
+        sync_pins = frozenset(cell.get_sync_pins())
+        reset_pins = frozenset(cell.get_reset_pins())
+        set_pins = frozenset(cell.get_set_pins())
+        return cls(
+            clock=tuple(cell.get_clock_pins()),
+            clock_negative=tuple(cell.get_clock_negative_pins()),
+            data=tuple(cell.get_data_pins()),
+            enable=tuple(cell.get_enable_pins()),
+            scan_enable=tuple(cell.get_scan_enable_pins()),
+            scan_in=tuple(cell.get_scan_in_pins()),
+            async_=async_pins,
+            sync=sync_pins,
+            reset=reset_pins,
+            set_=set_pins,
+            clear=async_pins & reset_pins,
+            preset=async_pins & set_pins,
+            clear_sync=sync_pins & reset_pins,
+            preset_sync=sync_pins & set_pins,
+        )
+
+
 class JsonCleaner:
     """Utility helpers to post-process the generated JSON structure."""
 
@@ -51,6 +207,7 @@ class JsonCleaner:
 
         This mirrors the behaviour in `legacy/spice/result_analyzer.py` and
         ensures the resulting JSON does not contain redundant placeholders.
+        A cleaned copy is returned; `data` is left untouched.
         """
         if isinstance(data, dict):
             return {
@@ -66,6 +223,51 @@ class JsonCleaner:
             ]
         return data
 
+    @staticmethod
+    def prune_empty_in_place(data: Any) -> Any:
+        """
+        In-place, non-recursive variant of `remove_empty`.
+
+        Drops the same entries as `remove_empty` but mutates `data` instead
+        of copying it, and returns it. Entries are judged by the values they
+        held before cleaning, so a container that only becomes empty through
+        cleaning is kept. All drop decisions are taken before anything is
+        removed, so a sub-tree shared by several parents is judged by its
+        original contents in each of them. Use it only on trees the caller
+        owns.
+        """
+        if not isinstance(data, (dict, list)):
+            return data
+
+        # Pass 1: find what to drop from each container, touching nothing.
+        drops: List[Tuple[Any, List[Any]]] = []
+        stack = [data]
+        visited = set()
+        while stack:
+            node = stack.pop()
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+            if isinstance(node, dict):
+                children = node.values()
+                empty_keys = [key for key, value in node.items() if _is_empty_json_value(value)]
+                if empty_keys:
+                    drops.append((node, empty_keys))
+            else:
+                children = node
+                if any(_is_empty_json_value(item) for item in node):
+                    drops.append((node, [item for item in node if not _is_empty_json_value(item)]))
+            stack.extend(child for child in children if isinstance(child, (dict, list)) and child)
+
+        # Pass 2: apply them (dicts lose keys, lists get their kept items).
+        for node, selection in drops:
+            if isinstance(node, dict):
+                for key in selection:
+                    del node[key]
+            else:
+                node[:] = selection
+        return data
+
     @staticmethod
     def compress_lists(json_string: str) -> str:
         """
@@ -75,13 +277,67 @@ class JsonCleaner:
         JSON file is written. We reproduce that behaviour here so downstream
         diffs stay minimal.
         """
-        pattern = re.compile(r"(\[[^\[\]]*?\])")
-        return pattern.sub(lambda match: match.group(0).replace("\n", "").replace(" ", ""), json_string)
+        # Only innermost arrays are compacted (those with no nested brackets),
+        # exactly as the legacy regex ``\[[^\[\]]*?\]`` did: after splitting on
+        # "[", each piece's text up to its first "]" is such an array body.
+        pieces = json_string.split("[")
+        for position in range(1, len(pieces)):
+            piece = pieces[position]
+            end = piece.find("]")
+            if end > 0:
+                pieces[position] = piece[:end].translate(_LIST_WHITESPACE) + piece[end:]
+        return "[".join(pieces)
+
+
+class _BracketMinifier:
+    """
+    Streaming counterpart of `JsonCleaner.compress_lists`.
+
+    Text is forwarded to `sink` as it arrives. After each "[" the text is held
+    back until the matching "]" (then written without whitespace) or until
+    another "[" shows the array is not innermost (then written unchanged), so
+    the output equals `compress_lists` over the concatenated input.
+    """
+
+    def __init__(self, sink: TextIO) -> None:
+        self._sink = sink
+        self._pending: Optional[List[str]] = None
+
+    def write(self, text: str) -> None:
+        pieces = text.split("[")
+        self._feed(pieces[0])
+        for piece in pieces[1:]:
+            if self._pending is not None:
+                self._sink.write("".join(self._pending))
+            self._sink.write("[")
+            self._pending = []
+            self._feed(piece)
+
+    def close(self) -> None:
+        if self._pending is not None:
+            self._sink.write("".join(self._pending))
+            self._pending = None
+
+    def _feed(self, piece: str) -> None:
+        if self._pending is None:
+            self._sink.write(piece)
+            return
+        end = piece.find("]")
+        if end < 0:
+            self._pending.append(piece)
+            return
+        self._pending.append(piece[:end])
+        self._sink.write("".join(self._pending).translate(_LIST_WHITESPACE))
+        self._sink.write(piece[end:])
+        self._pending = None
 
 
 class TemplateSerializer:
     """Convert Template objects into legacy JSON nodes."""
 
+    _SIZED_TEMPLATE_NAME_PATTERN = re.compile(r"^(.*)_([0-9]+)x([0-9]+)(_.+)?$")
+    _NUMBERED_TEMPLATE_NAME_PATTERN = re.compile(r"^(.*)_([0-9]+)$")
+
     def __init__(self) -> None:
         self._derived_power_templates: Dict[str, str] = {}
         self._derived_constraint_templates: Dict[str, str] = {}
@@ -98,9 +354,13 @@ class TemplateSerializer:
         power_lut_templates: Dict[str, Dict[str, Any]] = {}
 
         for template in library_db.templates.values():
+            # One list per axis, shared by the JSON node and the template spec;
+            # spec readers copy the indices before use.
+            idx1 = list(template.index_1)
+            idx2 = list(template.index_2)
             template_node = {
-                "index_1": list(template.index_1),
-                "index_2": list(template.index_2),
+                "index_1": idx1,
+                "index_2": idx2,
             }
 
             if template.template_type == "delay":
@@ -108,8 +368,8 @@ class TemplateSerializer:
                 template_node["variable_2"] = "total_output_net_capacitance"
                 lu_table_templates[template.name] = template_node
                 self._template_specs[template.name] = {
-                    "index_1": list(template.index_1),
-                    "index_2": list(template.index_2),
+                    "index_1": idx1,
+                    "index_2": idx2,
                     "variable_1": "input_net_transition",
                     "variable_2": "total_output_net_capacitance",
                 }
@@ -123,8 +383,8 @@ class TemplateSerializer:
                 derived_from = template.metadata.get("derived_from")
                 if derived_from:
                     spec = {
-                        "index_1": list(template.index_1),
-                        "index_2": list(template.index_2),
+                        "index_1": idx1,
+                        "index_2": idx2,
                         "variable_1": "constrained_pin_transition",
                     }
                     if template.index_2:
@@ -136,8 +396,8 @@ class TemplateSerializer:
 
                 lu_table_templates[template.name] = template_node
                 spec = {
-                    "index_1": list(template.index_1),
-                    "index_2": list(template.index_2),
+                    "index_1": idx1,
+                    "index_2": idx2,
                     "variable_1": "constrained_pin_transition",
                 }
                 if template.index_2:
@@ -150,24 +410,20 @@ class TemplateSerializer:
             elif template.template_type == "power":
                 template_node["variable_1"] = "input_transition_time"
                 self._template_specs[template.name] = {
-                    "index_1": list(template.index_1),
-                    "index_2": list(template.index_2),
+                    "index_1": idx1,
+                    "index_2": idx2,
                     "variable_1": "input_transition_time",
                     "variable_2": "total_output_net_capacitance" if template.index_2 else None,
                 }
 
                 derived_from = template.metadata.get("derived_from")
                 if derived_from:
-                    template_node["index_1"] = list(template.index_1)
                     power_lut_templates[template.name] = template_node
                     self._derived_power_templates[derived_from] = template.name
                     continue
 
-                template_node["index_1"] = list(template.index_1)
-
                 if template.index_2:
                     template_node["variable_2"] = "total_output_net_capacitance"
-                    template_node["index_2"] = list(template.index_2)
 
                 power_lut_templates[template.name] = template_node
 
@@ -221,17 +477,15 @@ class TemplateSerializer:
     def get_template_spec(self, name: str) -> Optional[Dict[str, Any]]:
         return self._template_specs.get(name)
 
-    @staticmethod
-    def _build_derived_power_template_name(base_name: str, rows: int) -> str:
-        import re
-
-        match = re.match(r"^(.*)_([0-9]+)x([0-9]+)(_.+)?$", base_name)
+    @classmethod
+    def _build_derived_power_template_name(cls, base_name: str, rows: int) -> str:
+        match = cls._SIZED_TEMPLATE_NAME_PATTERN.match(base_name)
         if match:
             prefix = match.group(1)
             suffix = match.group(4) or ""
             return f"{prefix}_{rows}x1{suffix}"
 
-        fallback_match = re.match(r"^(.*)_([0-9]+)$", base_name)
+        fallback_match = cls._NUMBERED_TEMPLATE_NAME_PATTERN.match(base_name)
         if fallback_match:
             prefix = fallback_match.group(1)
             suffix = fallback_match.group(2)
@@ -246,10 +500,14 @@ class CellSerializer:
     _SIMPLE_INVERSION_PATTERN = re.compile(
         r"^[!~]\s*\(?\s*([A-Za-z_][A-Za-z0-9_]*)\s*\)?\s*$"
     )
+    # Pin directions that carry a function / that drive a (sequential) output
+    _FUNCTION_PIN_DIRECTIONS = frozenset({"output", "inout", "internal"})
+    _DRIVING_PIN_DIRECTIONS = frozenset({"output", "inout"})
 
     def __init__(self, template_serializer: TemplateSerializer | None = None) -> None:
         self._template_serializer = template_serializer or TemplateSerializer()
         self._timing_table_cache: Dict[Tuple[str, str, str, str, str], Dict[str, Any]] = {}
+        self._seq_out_cache: Dict[Tuple[str, str], str] = {}
 
     @staticmethod
     def _normalize_state_variable_name(name: str) -> str:
@@ -313,16 +571,16 @@ class CellSerializer:
         return expr
 
     @staticmethod
-    def _serialize_async_timing_type(cell: Cell, related_pin: str, default: str = "clear") -> str:
+    def _serialize_async_timing_type(pin_sets: _PinSets, related_pin: str, default: str = "clear") -> str:
         """
         Liberty expects async set/reset arcs to use timing_type {clear,preset}.
 
         Internally we store both as TimingType.ASYNC; choose the proper Liberty
         string based on pin categories.
         """
-        if related_pin in set(cell.get_reset_pins()):
+        if related_pin in pin_sets.reset:
             return "clear"
-        if related_pin in set(cell.get_set_pins()):
+        if related_pin in pin_sets.set_:
             return "preset"
         # Backward-compatible fallback (legacy json2lib did async->clear blindly).
         return default
@@ -340,18 +598,7 @@ class CellSerializer:
         converged = bool(optimization.get("converged"))
 
         matrix = getattr(arc, "constraint_values", None) or []
-        finite_count = 0
-        for row in matrix:
-            if not isinstance(row, list):
-                continue
-            for value in row:
-                try:
-                    numeric = float(value)
-                except (TypeError, ValueError):
-                    continue
-                if not math.isfinite(numeric):
-                    continue
-                finite_count += 1
+        finite_count = _count_finite_values(matrix)
 
         outputs = getattr(arc, "output_condition_dict", {}) or {}
         output_key = tuple(sorted((str(pin), str(val)) for pin, val in outputs.items()))
@@ -403,8 +650,12 @@ class CellSerializer:
             Dictionary keyed by cell name with legacy-compliant payloads.
         """
         cell_nodes: Dict[str, Any] = {}
-        for cell_name, cell in library_db.cells.items():
-            cell_nodes[cell_name] = self._serialize_cell(cell, library_db)
+        try:
+            for cell_name, cell in library_db.cells.items():
+                cell_nodes[cell_name] = self._serialize_cell(cell, library_db)
+        finally:
+            # Keyed by cell name, so only meaningful within a single library
+            self._seq_out_cache.clear()
         return cell_nodes
 
     def _serialize_cell(self, cell: Cell, library_db: CellLibraryDB) -> Dict[str, Any]:
@@ -422,44 +673,41 @@ class CellSerializer:
                 continue
             cell_node["pins"][pin_name] = self._serialize_pin(cell, pin)
 
+        pin_sets = _PinSets.from_cell(cell)
+
         # Populate timing/internal power/leakage using arcs
-        self._populate_arc_data(cell, library_db, cell_node)
+        self._populate_arc_data(cell, library_db, cell_node, pin_sets)
 
-        latch_payload = self._build_latch_payload(cell)
+        latch_payload = self._build_latch_payload(cell, pin_sets)
         if latch_payload:
             state_var, state_var_n = self._resolve_state_variables(cell)
             cell_node[f"latch({state_var},{state_var_n})"] = latch_payload
         else:
             state_var, state_var_n = self._resolve_state_variables(cell)
-            ff_payload = self._build_ff_payload(cell, state_var)
+            ff_payload = self._build_ff_payload(cell, state_var, pin_sets)
             if ff_payload:
                 cell_node[f"ff({state_var},{state_var_n})"] = ff_payload
 
         return cell_node
 
-    def _build_latch_payload(self, cell: Cell) -> Optional[Dict[str, str]]:
+    def _build_latch_payload(self, cell: Cell, pin_sets: _PinSets) -> Optional[Dict[str, str]]:
         """Build legacy latch payload from cell pin categories."""
         if not cell.is_latch:
             return None
 
-        clock_pins = list(cell.get_clock_pins())
-        clock_negative_pins = list(cell.get_clock_negative_pins())
-        if clock_pins or clock_negative_pins:
+        if pin_sets.clock or pin_sets.clock_negative:
             return None
 
-        data_pins = list(cell.get_data_pins())
-        enable_pins = list(cell.get_enable_pins())
-        async_pins = set(cell.get_async_pins())
-        reset_pins = set(cell.get_reset_pins())
-        set_pins = set(cell.get_set_pins())
+        data_pins = pin_sets.data
+        enable_pins = pin_sets.enable
 
         data_pin = data_pins[0] if data_pins else None
         enable_pin = enable_pins[0] if enable_pins else None
         if data_pin is None or enable_pin is None:
             return None
 
-        clear_pins = list(async_pins & reset_pins)
-        preset_pins = list(async_pins & set_pins)
+        clear_pin = next(iter(pin_sets.clear), None)
+        preset_pin = next(iter(pin_sets.preset), None)
 
         latch_payload: Dict[str, str] = {
             "data_in": data_pin,
@@ -470,52 +718,45 @@ class CellSerializer:
             enable_expr = f"!{enable_pin}"
         latch_payload["enable"] = enable_expr
 
-        if clear_pins:
-            latch_payload["clear"] = f"!{clear_pins[0]}"
-        if preset_pins:
-            latch_payload["preset"] = f"!{preset_pins[0]}"
-        if clear_pins and preset_pins:
+        if clear_pin is not None:
+            latch_payload["clear"] = f"!{clear_pin}"
+        if preset_pin is not None:
+            latch_payload["preset"] = f"!{preset_pin}"
+        if clear_pin is not None and preset_pin is not None:
             latch_payload["clear_preset_var1"] = "H"
             latch_payload["clear_preset_var2"] = "L"
 
         return latch_payload
 
-    def _build_ff_payload(self, cell: Cell, state_var: str) -> Optional[Dict[str, str]]:
+    def _build_ff_payload(self, cell: Cell, state_var: str, pin_sets: _PinSets) -> Optional[Dict[str, str]]:
         """Build legacy ff/latch payload from cell pin categories."""
         if not (cell.is_sequential or cell.has_async_pins):
             return None
 
-        clock_pins = list(cell.get_clock_pins())
-        clock_negative_pins = list(cell.get_clock_negative_pins())
-        sync_pins = set(cell.get_sync_pins())
-        async_pins = set(cell.get_async_pins())
-        reset_pins = set(cell.get_reset_pins())
-        set_pins = set(cell.get_set_pins())
-        data_pins = list(cell.get_data_pins())
-        scan_enable_pins = list(cell.get_scan_enable_pins())
-        scan_in_pins = list(cell.get_scan_in_pins())
-        enable_pins = list(cell.get_enable_pins())
-
-        clear_sync_pins = list(sync_pins & reset_pins)
-        preset_sync_pins = list(sync_pins & set_pins)
-        clear_pins = list(async_pins & reset_pins)
-        preset_pins = list(async_pins & set_pins)
+        clock_pins = pin_sets.clock
+        clock_negative_pins = pin_sets.clock_negative
+        data_pins = pin_sets.data
+        scan_enable_pins = pin_sets.scan_enable
+        scan_in_pins = pin_sets.scan_in
+        enable_pins = pin_sets.enable
 
         data_pin = data_pins[0] if data_pins else None
         scan_enable_pin = scan_enable_pins[0] if scan_enable_pins else None
         scan_in_pin = scan_in_pins[0] if scan_in_pins else None
         enable_pin = enable_pins[0] if enable_pins else None
-        preset_sync_pin = preset_sync_pins[0] if preset_sync_pins else None
-        clear_sync_pin = clear_sync_pins[0] if clear_sync_pins else None
+        preset_sync_pin = next(iter(pin_sets.preset_sync), None)
+        clear_sync_pin = next(iter(pin_sets.clear_sync), None)
 
         if data_pin is None and scan_in_pin is None:
             return None
 
         ff_payload: Dict[str, str] = {}
-        if clear_pins:
-            ff_payload["clear"] = f"(!{clear_pins[0]})"
-        if preset_pins:
-            ff_payload["preset"] = f"(!{preset_pins[0]})"
+        clear_pin = next(iter(pin_sets.clear), None)
+        preset_pin = next(iter(pin_sets.preset), None)
+        if clear_pin is not None:
+            ff_payload["clear"] = f"(!{clear_pin})"
+        if preset_pin is not None:
+            ff_payload["preset"] = f"(!{preset_pin})"
 
         if clock_pins:
             ff_payload["clocked_on"] = clock_pins[0]
@@ -524,34 +765,15 @@ class CellSerializer:
         elif enable_pin:
             ff_payload["clocked_on"] = enable_pin
 
-        next_state_expr = data_pin
-        if preset_sync_pin:
-            next_state_expr = f"(!{preset_sync_pin} + {data_pin})"
-        if clear_sync_pin:
-            next_state_expr = f"({data_pin} * {clear_sync_pin})"
-        if preset_sync_pin and clear_sync_pin:
-            next_state_expr = f"((!{preset_sync_pin} + {data_pin}) * {clear_sync_pin})"
-        if enable_pin:
-            next_state_expr = f"(({enable_pin} * {data_pin}) + (!{enable_pin} * {state_var}))"
-        if enable_pin and clear_sync_pin:
-            next_state_expr = f"(({enable_pin} * {data_pin}) + (!{enable_pin} * {state_var}) * {clear_sync_pin})"
-        if scan_enable_pin:
-            next_state_expr = f"(({scan_in_pin} * {scan_enable_pin}) + (!{scan_enable_pin} * {data_pin}))"
-        if scan_enable_pin and preset_sync_pin:
-            next_state_expr = f"(({scan_in_pin} * {scan_enable_pin}) + (!{scan_enable_pin} * (!{preset_sync_pin} + {data_pin})))"
-        if scan_enable_pin and clear_sync_pin:
-            next_state_expr = f"(({scan_enable_pin} * {scan_in_pin}) +(!{scan_enable_pin}*({data_pin} * {clear_sync_pin})))"
-        if scan_enable_pin and preset_sync_pin and clear_sync_pin:
-            next_state_expr = f"(({scan_enable_pin} * {scan_in_pin}) + (!{scan_enable_pin}*((!{preset_sync_pin} + {data_pin}) * {clear_sync_pin})))"
-        if enable_pin and scan_enable_pin:
-            next_state_expr = (
-                f"(({scan_in_pin} * {scan_enable_pin}) + (!{scan_enable_pin} * (({enable_pin} * {data_pin}) + (!{enable_pin} * {state_var}))))"
-            )
-        if enable_pin and scan_enable_pin and clear_sync_pin:
-            next_state_expr = (
-                f"(({scan_in_pin} * {scan_enable_pin}) + (!{scan_enable_pin} * (({enable_pin} * {data_pin}) + (!{enable_pin} * {state_var})) * {clear_sync_pin}))"
-            )
-
+        next_state_expr = self._build_next_state_expr(
+            state_var,
+            data_pin,
+            scan_in_pin,
+            scan_enable_pin,
+            enable_pin,
+            preset_sync_pin,
+            clear_sync_pin,
+        )
         if next_state_expr:
             ff_payload["next_state"] = next_state_expr
 
@@ -561,24 +783,69 @@ class CellSerializer:
 
         return ff_payload
 
+    @staticmethod
+    def _build_next_state_expr(
+        state_var: str,
+        data_pin: Optional[str],
+        scan_in_pin: Optional[str],
+        scan_enable_pin: Optional[str],
+        enable_pin: Optional[str],
+        preset_sync_pin: Optional[str],
+        clear_sync_pin: Optional[str],
+    ) -> Optional[str]:
+        """Select the next_state expression; branches are ordered by precedence."""
+        if scan_enable_pin and enable_pin and clear_sync_pin:
+            return (
+                f"(({scan_in_pin} * {scan_enable_pin}) + (!{scan_enable_pin} * (({enable_pin} * {data_pin}) + (!{enable_pin} * {state_var})) * {clear_sync_pin}))"
+            )
+        if scan_enable_pin and enable_pin:
+            return (
+                f"(({scan_in_pin} * {scan_enable_pin}) + (!{scan_enable_pin} * (({enable_pin} * {data_pin}) + (!{enable_pin} * {state_var}))))"
+            )
+        if scan_enable_pin and preset_sync_pin and clear_sync_pin:
+            return f"(({scan_enable_pin} * {scan_in_pin}) + (!{scan_enable_pin}*((!{preset_sync_pin} + {data_pin}) * {clear_sync_pin})))"
+        if scan_enable_pin and clear_sync_pin:
+            return f"(({scan_enable_pin} * {scan_in_pin}) +(!{scan_enable_pin}*({data_pin} * {clear_sync_pin})))"
+        if scan_enable_pin and preset_sync_pin:
+            return f"(({scan_in_pin} * {scan_enable_pin}) + (!{scan_enable_pin} * (!{preset_sync_pin} + {data_pin})))"
+        if scan_enable_pin:
+            return f"(({scan_in_pin} * {scan_enable_pin}) + (!{scan_enable_pin} * {data_pin}))"
+        if enable_pin and clear_sync_pin:
+            return f"(({enable_pin} * {data_pin}) + (!{enable_pin} * {state_var}) * {clear_sync_pin})"
+        if enable_pin:
+            return f"(({enable_pin} * {data_pin}) + (!{enable_pin} * {state_var}))"
+        if preset_sync_pin and clear_sync_pin:
+            return f"((!{preset_sync_pin} + {data_pin}) * {clear_sync_pin})"
+        if clear_sync_pin:
+            return f"({data_pin} * {clear_sync_pin})"
+        if preset_sync_pin:
+            return f"(!{preset_sync_pin} + {data_pin})"
+        return data_pin
+
     def _serialize_pin(self, cell: Cell, pin: PinInfo) -> Dict[str, Any]:
         function_str = ""
-        if pin.direction in {"output", "inout", "internal"}:
+        if pin.direction in self._FUNCTION_PIN_DIRECTIONS:
             func = cell.get_function(pin.name)
             if func:
                 function_str = func.original_expr
 
-        if pin.direction in {"output", "inout"} and function_str:
-            function_str = self._serialize_sequential_output_function(cell, function_str)
+        if pin.direction in self._DRIVING_PIN_DIRECTIONS and function_str:
+            cache_key = (cell.name, function_str)
+            cached = self._seq_out_cache.get(cache_key)
+            if cached is None:
+                cached = self._serialize_sequential_output_function(cell, function_str)
+                self._seq_out_cache[cache_key] = cached
+            function_str = cached
 
+        metadata = pin.metadata
         pin_node: Dict[str, Any] = {
             "direction": pin.direction,
             "function": function_str,
             "capacitance": pin.capacitance,
-            "rise_capacitance": pin.metadata.get("rise_capacitance"),
-            "rise_capacitance_range": pin.metadata.get("rise_capacitance_range", []),
-            "fall_capacitance": pin.metadata.get("fall_capacitance"),
-            "fall_capacitance_range": pin.metadata.get("fall_capacitance_range", []),
+            "rise_capacitance": metadata.get("rise_capacitance"),
+            "rise_capacitance_range": list(metadata.get("rise_capacitance_range", ())),
+            "fall_capacitance": metadata.get("fall_capacitance"),
+            "fall_capacitance_range": list(metadata.get("fall_capacitance_range", ())),
             "timing": [],
             "internal_power": [],
         }
@@ -588,7 +855,13 @@ class CellSerializer:
 
         return pin_node
 
-    def _populate_arc_data(self, cell: Cell, library_db: CellLibraryDB, cell_node: Dict[str, Any]) -> None:
+    def _populate_arc_data(
+        self,
+        cell: Cell,
+        library_db: CellLibraryDB,
+        cell_node: Dict[str, Any],
+        pin_sets: _PinSets,
+    ) -> None:
         timing_groups: Dict[
             Tuple[str, str, str, str],
             Dict[str, Any]
@@ -600,24 +873,23 @@ class CellSerializer:
         leakage_entries: List[Dict[str, Any]] = []
 
         pins_payload = cell_node["pins"]
-        clock_pins = set(cell.get_clock_pins())
-        control_pins = clock_pins | set(cell.get_enable_pins()) | set(cell.get_async_pins())
-        reset_pins = set(cell.get_reset_pins())
-        set_pins = set(cell.get_set_pins())
+        control_pins = pin_sets.async_.union(pin_sets.clock, pin_sets.enable)
+        reset_pins = pin_sets.reset
+        set_pins = pin_sets.set_
 
         for arc in cell.timing_arcs:
             if (
-                arc.timing_type == TimingType.MIN_PULSE_WIDTH.value
+                arc.timing_type == _MIN_PULSE_WIDTH_TYPE
                 and arc.pin not in control_pins
             ):
                 continue
             # Skip arcs that do not map to a real pin payload (e.g., '-' placeholders)
-            if arc.pin not in pins_payload or arc.pin == "-":
-                if arc.table_type == TableType.LEAKAGE_POWER.value:
+            if arc.pin == "-" or arc.pin not in pins_payload:
+                if arc.table_type == _LEAKAGE_POWER_TABLE:
                     leakage_entries.append(self._serialize_leakage_power(cell, arc))
                 continue
 
-            if arc.table_type in {TableType.RISE_POWER.value, TableType.FALL_POWER.value}:
+            if arc.table_type in _POWER_TABLES:
                 # Hidden power arcs (input pin power) do not have a related pin, but may need
                 # a `when` condition for sequential/output-state-dependent cases.
                 is_hidden_power = (
@@ -633,7 +905,13 @@ class CellSerializer:
                     when_str = self._format_when(arc.condition_string(cell=cell))
                     related_pin = arc.related_pin
 
-                pg_pin = (arc.metadata or {}).get("related_pg_pin", "")
+                arc_metadata = arc.metadata
+                if arc_metadata:
+                    pg_pin = arc_metadata.get("related_pg_pin", "")
+                    override_template = arc_metadata.get("power_template_override")
+                else:
+                    pg_pin = ""
+                    override_template = None
                 key = (arc.pin, related_pin, when_str, pg_pin)
                 power_entry = power_groups.setdefault(
                     key,
@@ -643,8 +921,7 @@ class CellSerializer:
                         "related_pg_pin": pg_pin,
                     },
                 )
-                table_key = "rise_power" if arc.table_type == TableType.RISE_POWER.value else "fall_power"
-                override_template = arc.metadata.get("power_template_override") if arc.metadata else None
+                table_key = "rise_power" if arc.table_type == _RISE_POWER_TABLE else "fall_power"
                 template_name = override_template or cell.power_template
                 table_data = self._build_table(
                     template_name,
@@ -655,13 +932,13 @@ class CellSerializer:
                     power_entry[table_key] = table_data
                 continue
 
-            if arc.table_type == TableType.LEAKAGE_POWER.value:
+            if arc.table_type == _LEAKAGE_POWER_TABLE:
                 leakage_entries.append(self._serialize_leakage_power(cell, arc))
                 continue
 
-            is_min_pulse = arc.timing_type == TimingType.MIN_PULSE_WIDTH.value
+            is_min_pulse = arc.timing_type == _MIN_PULSE_WIDTH_TYPE
             export_timing_type = arc.timing_type
-            if arc.timing_type == TimingType.ASYNC.value:
+            if arc.timing_type == _ASYNC_TYPE:
                 # Map to Liberty-visible timing_type ("clear"/"preset") based on the control pin.
                 if arc.related_pin in reset_pins:
                     export_timing_type = "clear"
@@ -680,15 +957,15 @@ class CellSerializer:
             is_clock_edge = arc.timing_type in ('rising_edge', 'falling_edge')
             group_when = "" if is_clock_edge else (formatted_when or "")
             key = (arc.pin, arc.related_pin, export_timing_type, group_when)
-            if key not in timing_groups:
-                entry = {
+            timing_entry = timing_groups.get(key)
+            if timing_entry is None:
+                timing_entry = {
                     "related_pin": arc.related_pin,
                     "timing_type": export_timing_type,
                 }
                 if not is_clock_edge and group_when:
-                    entry["when"] = formatted_when
-                timing_groups[key] = entry
-            timing_entry = timing_groups[key]
+                    timing_entry["when"] = formatted_when
+                timing_groups[key] = timing_entry
             if is_clock_edge:
                 timing_entry.pop("when", None)
             elif formatted_when:
@@ -697,17 +974,18 @@ class CellSerializer:
             table_payload = self._build_timing_table(cell, arc, library_db)
             if table_payload:
                 if is_min_pulse:
-                    candidates = timing_entry.setdefault("_mpw_candidates", defaultdict(list))
-                    for constraint_key in (
-                        TableType.RISE_CONSTRAINT.value,
-                        TableType.FALL_CONSTRAINT.value,
-                    ):
+                    candidates = timing_entry.get("_mpw_candidates")
+                    if candidates is None:
+                        candidates = timing_entry["_mpw_candidates"] = {
+                            constraint_key: [] for constraint_key in _CONSTRAINT_TABLES
+                        }
+                    for constraint_key in _CONSTRAINT_TABLES:
                         if constraint_key in table_payload:
                             values = table_payload[constraint_key].get("values")
                             if values:
                                 candidates[constraint_key].append(list(values))
                     timing_entry.update(table_payload)
-                elif arc.table_type in {TableType.RISE_CONSTRAINT.value, TableType.FALL_CONSTRAINT.value}:
+                elif arc.table_type in _CONSTRAINT_TABLES:
                     # Multiple constraint variants can collide in the same Liberty timing() group.
                     # Choose the best candidate instead of last-write-wins.
                     self._select_best_constraint_payload(timing_entry, arc, table_payload)
@@ -728,7 +1006,7 @@ class CellSerializer:
                     if payload:
                         entry.update(payload)
             if (
-                entry.get("timing_type") == TimingType.MIN_PULSE_WIDTH.value
+                entry.get("timing_type") == _MIN_PULSE_WIDTH_TYPE
                 and "_mpw_candidates" in entry
             ):
                 candidates = entry.pop("_mpw_candidates", None) or {}
@@ -736,7 +1014,8 @@ class CellSerializer:
                     [vec for vectors in candidates.values() for vec in vectors]
                 )
                 for table_key, vectors in candidates.items():
-                    if table_key not in entry:
+                    # Only tables that received candidate vectors are re-merged.
+                    if not vectors or table_key not in entry:
                         continue
                     merged = self._merge_mpw_vectors(vectors)
                     if not merged:
@@ -952,6 +1231,13 @@ class CellSerializer:
             if not values:
                 return None
             first = values[0]
+            # Large regular tables are validated in one pass; None entries
+            # become NaN and fail the finite check like _coerce_numeric.
+            array = _as_regular_float_array(values, 2 if isinstance(first, list) else 1)
+            if array is not None:
+                if array.size == 0 or not np.isfinite(array).all():
+                    return None
+                return array.tolist()
             if isinstance(first, list):
                 sanitized_matrix: List[List[float]] = []
                 has_data = False
@@ -986,8 +1272,18 @@ class CellSerializer:
         if not vectors:
             return []
 
-        length = max(len(vec) for vec in vectors)
         placeholder = 1e-4
+        stacked = _stack_vectors(vectors)
+        if stacked is not None:
+            # Placeholders and NaN never win the column maximum.
+            stacked[~(stacked > placeholder)] = -np.inf
+            column_max = stacked.max(axis=0)
+            keep = column_max > placeholder
+            if not keep.any():
+                return []
+            return np.where(keep, column_max, 0.0).tolist()
+
+        length = max(len(vec) for vec in vectors)
         merged = [0.0] * length
 
         for vec in vectors:
@@ -1011,6 +1307,11 @@ class CellSerializer:
         def merge_max(vectors: List[List[float]]) -> List[float]:
             if not vectors:
                 return []
+            stacked = _stack_vectors(vectors)
+            if stacked is not None:
+                stacked[np.isnan(stacked)] = -np.inf
+                column_max = stacked.max(axis=0)
+                return np.where(column_max > 0.0, column_max, 0.0).tolist()
             length = max(len(vec) for vec in vectors)
             merged = [0.0] * length
             for vec in vectors:
@@ -1322,6 +1623,9 @@ class LibraryJsonExporter:
     and returns the path to the generated JSON payload.
     """
 
+    _WRITE_BUFFER_SIZE = 1 << 20
+    _ENCODE_BATCH_CHUNKS = 4096
+
     def __init__(
         self,
         *,
@@ -1346,13 +1650,42 @@ class LibraryJsonExporter:
         """
         logger.info("Exporting CellLibraryDB to legacy JSON at %s", output_path)
         legacy_dict = self.serializer.build_library_dict(library_db)
-        cleaned_dict = self.cleaner.remove_empty(legacy_dict)
-        json_payload = self._dumps(cleaned_dict)
+        # legacy_dict was built just above, so it can be pruned in place
+        cleaned_dict = self.cleaner.prune_empty_in_place(legacy_dict)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(json_payload)
+        # _BracketMinifier reproduces JsonCleaner.compress_lists only; a
+        # cleaner that overrides it gets the whole-string path instead.
+        if type(self.cleaner).compress_lists is JsonCleaner.compress_lists:
+            with output_path.open("w", buffering=self._WRITE_BUFFER_SIZE) as handle:
+                self._write_json(cleaned_dict, handle)
+        else:
+            output_path.write_text(self._dumps(cleaned_dict))
         logger.debug("Wrote legacy JSON file with size %d bytes", output_path.stat().st_size)
         return output_path
 
+    def _write_json(self, payload: Dict[str, Any], handle: TextIO) -> None:
+        """
+        Stream the payload into `handle`, formatted exactly like `_dumps`.
+
+        Indented output is streamed: encoder chunks are batched before list
+        compaction so the whole JSON document never has to exist as one
+        string. CPython only uses its C encoder for one-shot, unindented
+        encoding, so compact output is encoded in one `json.dumps` call.
+        """
+        if self.config.pretty:
+            chunks = json.JSONEncoder(indent=self.config.indent).iterencode(payload)
+        else:
+            chunks = iter((json.dumps(payload),))
+        writer = _BracketMinifier(handle)
+        batch: List[str] = []
+        for chunk in chunks:
+            batch.append(chunk)
+            if len(batch) >= self._ENCODE_BATCH_CHUNKS:
+                writer.write("".join(batch))
+                batch.clear()
+        writer.write("".join(batch))
+        writer.close()
+
     def _dumps(self, payload: Dict[str, Any]) -> str:
         """Serialize payload to JSON and apply legacy-compatible formatting."""
         json_text = json.dumps(payload, indent=self.config.indent if self.config.pretty else None)
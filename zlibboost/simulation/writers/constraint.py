@@ -86,13 +86,14 @@ class ConstraintResultWriter(ResultWriter):
         self._ensure_unique_entries(matrix)
         arc.set_constraint_values(matrix)
 
+        sim_metadata = arc.ensure_simulation_metadata()
         artifacts = result.data.get("artifacts") or {}
         measurement_file = artifacts.get("measurement_file")
         if measurement_file:
-            arc.simulation_metadata["measurement_file"] = measurement_file
-        arc.simulation_metadata["engine"] = result.engine
-        arc.simulation_metadata["sim_type"] = result.job.sim_type
-        arc.simulation_metadata["optimization"] = {
+            sim_metadata["measurement_file"] = measurement_file
+        sim_metadata["engine"] = result.engine
+        sim_metadata["sim_type"] = result.job.sim_type
+        sim_metadata["optimization"] = {
             "time_shift": metrics.get("time_shift"),
             "iterations": metrics.get("optimization_iterations"),
             "target": metrics.get("optimization_target"),
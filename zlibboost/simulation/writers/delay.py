@@ -86,12 +86,13 @@ class DelayResultWriter(ResultWriter):
 
         self._update_capacitances(cell, arc.related_pin, metrics)
 
+        sim_metadata = arc.ensure_simulation_metadata()
         artifacts = result.data.get("artifacts") or {}
         measurement_file = artifacts.get("measurement_file")
         if measurement_file:
-            arc.simulation_metadata["measurement_file"] = measurement_file
-        arc.simulation_metadata["engine"] = result.engine
-        arc.simulation_metadata["sim_type"] = result.job.sim_type
+            sim_metadata["measurement_file"] = measurement_file
+        sim_metadata["engine"] = result.engine
+        sim_metadata["sim_type"] = result.job.sim_type
 
         self._append_results_log(result, cell_dir=result.job.output_dir)
 
@@ -101,21 +101,22 @@ class MpwResultWriter(ResultWriter):
         vector[i1] = float(value)
         arc.set_mpw_values(vector)
 
+        sim_metadata = arc.ensure_simulation_metadata()
         if hit_bound:
-            arc.simulation_metadata["mpw_hit_bound"] = True
+            sim_metadata["mpw_hit_bound"] = True
             if bound_ns is not None:
-                arc.simulation_metadata["mpw_search_bound_ns"] = float(bound_ns)
+                sim_metadata["mpw_search_bound_ns"] = float(bound_ns)
 
         artifacts = result.data.get("artifacts") or {}
         measurement_file = artifacts.get("measurement_file")
         if measurement_file:
-            arc.simulation_metadata["measurement_file"] = measurement_file
-        arc.simulation_metadata["engine"] = result.engine
-        arc.simulation_metadata["sim_type"] = result.job.sim_type
+            sim_metadata["measurement_file"] = measurement_file
+        sim_metadata["engine"] = result.engine
+        sim_metadata["sim_type"] = result.job.sim_type
 
         optimization = (result.data.get("metadata") or {}).get("optimization")
         if optimization:
-            arc.simulation_metadata["optimization"] = optimization
+            sim_metadata["optimization"] = optimization
 
         self._append_results_log(result, result.job.output_dir)
 